@@ -2,12 +2,34 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Tuple
 
 
 logger = logging.getLogger(__name__)
 
+_CONVERTER_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _converter() -> Any:
+    from docling.document_converter import DocumentConverter
+
+    return DocumentConverter()
+
+
+def _get_converter() -> Any:
+    """
+    Return the process-wide Docling converter, building it on first use.
+
+    Construction loads the layout/OCR models, so it is done once and guarded by
+    a lock so concurrent first requests from the threadpool do not race.
+    """
+    with _CONVERTER_LOCK:
+        return _converter()
+
 
 def parse_to_markdown(src_path: Path, work_dir: Path) -> Tuple[Path, Path]:
     """
@@ -29,7 +51,7 @@ def parse_to_markdown(src_path: Path, work_dir: Path) -> Tuple[Path, Path]:
         Locations of the generated Markdown and layout JSON files.
     """
     try:
-        from docling.document_converter import DocumentConverter
+        converter = _get_converter()
     except ImportError as exc:  # pragma: no cover - import guard
         raise RuntimeError(
             "Docling is not installed. Ensure `docling` is present in the runtime environment."
@@ -40,7 +62,6 @@ def parse_to_markdown(src_path: Path, work_dir: Path) -> Tuple[Path, Path]:
     layout_path = work_dir / "layout.json"
 
     logger.info("Docling converting %s -> %s", src_path.name, md_path.name)
-    converter = DocumentConverter()
     try:
         result = converter.convert(str(src_path))
     except Exception as exc:  # pragma: no cover - docling runtime failure guard
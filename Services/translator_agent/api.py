@@ -1,16 +1,22 @@
 import asyncio
-import io
+import hashlib
+import json
 import logging
 import os
-import shutil
+import re
+import stat
+import tempfile
+import threading
 import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Literal
+from typing import Any, Callable, Dict, List, Optional, Union, Literal
 
-from fastapi import FastAPI, File, HTTPException, Query, UploadFile
+from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, HttpUrl
 
 from ingestion.url_loader import fetch_url
@@ -71,52 +77,127 @@ app.add_middleware(
 
 def _job_dir(base: Optional[Path] = None) -> Path:
     base = base or Path.cwd()
-    p = base / f"job_{int(time.time())}_{uuid.uuid4().hex[:6]}"
+    p = base / f"job_{os.urandom(6).hex()}"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
-def _extract_html_from_blob(path: str, blob: bytes) -> str:
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def _spool_upload(file: UploadFile, dest: Path) -> Path:
+    """Copy an upload to ``dest`` in fixed-size chunks instead of buffering it whole."""
+    with dest.open("wb") as fp:
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            fp.write(chunk)
+    await file.close()
+    return dest
+
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=settings.parse_workers)
+    return _PARSE_POOL
+
+
+@app.on_event("shutdown")
+def _shutdown_parse_pool() -> None:
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(cancel_futures=True)
+        _PARSE_POOL = None
+
+
+async def _run_parse(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a CPU-bound parser in the worker process pool.
+
+    ``fn`` must be a module-level function and ``args`` picklable (paths, not
+    file objects); workers read the spooled upload from disk themselves.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_parse_pool(), fn, *args)
+
+async def _extract_html_from_blob(path: str, source: Union[bytes, Path]) -> str:
     kind = sniff_type(path)
     if kind == "html":
+        blob = source.read_bytes() if isinstance(source, Path) else source
         return blob.decode("utf-8", errors="ignore")
     if kind == "pdf":
-        return pdf_to_html_like(blob)
+        return await _run_parse(pdf_to_html_like, source)
     if kind == "docx":
-        return docx_to_html(blob)
+        return await _run_parse(docx_to_html, source)
     raise HTTPException(status_code=400, detail=f"Unsupported file type: {kind}")
 
+_ANALYZED_HTML: Dict[bytes, tuple[str, str]] = {}
+_ANALYZED_HTML_MAX = 32
+# Sync endpoints call _analyze_html from Starlette's threadpool
+_ANALYZED_HTML_LOCK = threading.Lock()
+
+
+def _analyze_html(html: str) -> tuple[dict, str]:
+    """
+    Parse HTML into IR and detect its language, memoized on a digest of the HTML
+    so re-submitted content (refresh, translate-again) is not re-parsed.
+
+    The IR is cached as JSON and rebuilt per call, so callers own what they get.
+    """
+    key = hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest()
+    with _ANALYZED_HTML_LOCK:
+        cached = _ANALYZED_HTML.get(key)
+    if cached is None:
+        ir = html_to_ir(html)
+        cached = (json.dumps(ir), detect_lang_doc(ir))
+        with _ANALYZED_HTML_LOCK:
+            _ANALYZED_HTML[key] = cached
+            if len(_ANALYZED_HTML) > _ANALYZED_HTML_MAX:
+                _ANALYZED_HTML.pop(next(iter(_ANALYZED_HTML)))
+    ir_json, lang = cached
+    return json.loads(ir_json), lang
+
 def _extract_html_from_url(url: str) -> str:
     html = fetch_url(url)
     return extract_main_article_html(html, base_url=url)
 
-def _check_credible_api() -> bool:
-    """Check if we have a credible API key and it's reachable."""
+_API_CHECK_TTL_S = 60
+
+
+@lru_cache(maxsize=1)
+def _credible_api_for(_bucket: int) -> bool:
     # Simple check for now - just check if API key exists
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         return False
-    
+
     # In a full implementation, we'd make a test call to verify the API works
     # For now, just check if the key exists
     return len(api_key.strip()) > 0
 
-def _create_no_api_placeholder(source_ir: Document) -> Document:
-    """Create a target IR with a single 'no credible API' message."""
-    from models.ir_v2 import DocumentMeta, Section, Paragraph, Span, Heading
-    
+def _check_credible_api() -> bool:
+    """Check if we have a credible API key; re-evaluated at most once per TTL window."""
+    return _credible_api_for(int(time.monotonic() // _API_CHECK_TTL_S))
+
+@lru_cache(maxsize=1)
+def _placeholder_sections() -> tuple:
+    """Static 'no credible API' sections, built once; callers get deep copies."""
+    from models.ir_v2 import Section, Paragraph, Span, Heading
+
     # Create a simple placeholder document with just one message
     placeholder_blocks = [
         Heading(level=1, spans=[Span(text="Translation Not Available")]),
         Paragraph(spans=[Span(text="Translation service is not available. Please configure API credentials to enable translation.")]),
         Paragraph(spans=[Span(text="Original document structure has been preserved above.")])
     ]
-    
+
     # Create placeholder sections - just one section with the message
-    placeholder_sections = [Section(
-        index=0,
-        blocks=placeholder_blocks
-    )]
-    
+    return (Section(index=0, blocks=placeholder_blocks),)
+
+def _create_no_api_placeholder(source_ir: Document) -> Document:
+    """Create a target IR with a single 'no credible API' message."""
+    from models.ir_v2 import DocumentMeta
+
     # Create target document
     target_meta = DocumentMeta(
         title=f"Translation of {source_ir.meta.title or 'Document'}",
@@ -126,12 +207,13 @@ def _create_no_api_placeholder(source_ir: Document) -> Document:
         pages=source_ir.meta.pages,
         word_count=source_ir.meta.word_count
     )
-    
-    return Document(meta=target_meta, sections=placeholder_sections)
+
+    return Document(meta=target_meta, sections=[s.model_copy(deep=True) for s in _placeholder_sections()])
 
 # ---- docling endpoints ----
 
 DOC_JOB_ROOT = Path(__file__).resolve().parent
+_DOCLING_JOB_ID_RE = re.compile(r"job_[0-9a-f]{32}")
 NO_CREDIBLE_API = "NO credible API"
 
 
@@ -155,28 +237,71 @@ def _create_docling_job_dirs() -> tuple[str, Path, Path, Path, Path]:
     source_dir = job_dir / "source"
     assets_dir = job_dir / "assets"
     out_dir = job_dir / "out"
-    for directory in (job_dir, source_dir, assets_dir, out_dir):
+    # assets/ is left to be created by whoever writes the first asset, so its
+    # existence alone tells _has_assets whether the job has any.
+    for directory in (job_dir, source_dir, out_dir):
         directory.mkdir(parents=True, exist_ok=True)
     return job_id, job_dir, source_dir, assets_dir, out_dir
 
 
 def _resolve_docling_job(job_id: str) -> Path:
-    if not job_id or not job_id.startswith("job_"):
+    # The id format admits no separators or dots, so the path cannot escape
+    # DOC_JOB_ROOT and needs no resolve(); one stat checks it exists.
+    if not _DOCLING_JOB_ID_RE.fullmatch(job_id or ""):
         raise HTTPException(status_code=404, detail="Job not found")
-    job_dir = (DOC_JOB_ROOT / job_id).resolve()
-    if not job_dir.exists() or DOC_JOB_ROOT not in job_dir.parents:
+    job_dir = DOC_JOB_ROOT / job_id
+    if not job_dir.is_dir():
         raise HTTPException(status_code=404, detail="Job not found")
     return job_dir
 
 
-def _has_assets(assets_dir: Path) -> bool:
-    if not assets_dir.exists():
-        return False
+@lru_cache(maxsize=1024)
+def _resolve_docling_asset(job_id: str, asset_path: str) -> Optional[Path]:
+    """Resolve an asset path inside a job's assets dir, or ``None`` if it escapes it."""
+    assets_dir = DOC_JOB_ROOT / job_id / "assets"
+    candidate = (assets_dir / asset_path).resolve()
+    if assets_dir.resolve() not in candidate.parents:
+        return None
+    return candidate
+
+
+def _regular_file_stat(path: Path) -> Optional[os.stat_result]:
     try:
-        next(assets_dir.iterdir())
-        return True
-    except StopIteration:
-        return False
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+def _conditional_file_response(
+    request: Request,
+    path: Path,
+    stat_result: os.stat_result,
+    headers: Optional[Dict[str, str]] = None,
+    **kwargs: Any,
+) -> Response:
+    """
+    Serve ``path`` with the stat we already took, answering ``304`` when the
+    client's ``If-None-Match`` matches the ETag Starlette derives from it.
+    """
+    response = FileResponse(path, stat_result=stat_result, headers=headers, **kwargs)
+    etag = response.headers["etag"]
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        not_modified = {"etag": etag}
+        not_modified.update(headers or {})
+        return Response(status_code=304, headers=not_modified)
+    return response
+
+
+def _write_job_files(files: Dict[Path, str]) -> None:
+    """Write a batch of per-job text files; meant to run off the event loop."""
+    for path, text in files.items():
+        path.write_text(text, encoding="utf-8")
+
+
+def _has_assets(assets_dir: Path) -> bool:
+    return assets_dir.is_dir()
 
 
 @app.post("/docling/extract")
@@ -184,23 +309,23 @@ async def docling_extract(file: UploadFile = File(...)):
     job_id, job_dir, source_dir, assets_dir, _ = _create_docling_job_dirs()
 
     source_filename = file.filename or "uploaded_file"
-    source_path = source_dir / source_filename
-
-    with source_path.open("wb") as destination:
-        shutil.copyfileobj(file.file, destination)
-    await file.close()
+    source_path = await _spool_upload(file, source_dir / source_filename)
 
     try:
-        markdown_path, _layout_path = parse_to_markdown(source_path, job_dir)
+        # Docling stays in the threadpool: its converter is cached per process
+        # and too heavy to load again in every parse worker.
+        markdown_path, _layout_path = await asyncio.to_thread(parse_to_markdown, source_path, job_dir)
     except Exception as exc:
         logger.exception("Docling parse failed for %s", job_id)
         raise HTTPException(status_code=500, detail="Docling parsing failed") from exc
 
     raw_markdown = markdown_path.read_text(encoding="utf-8")
-    (job_dir / "content.original.md").write_text(raw_markdown, encoding="utf-8")
-
     cleaned_markdown = deinline_data_uri_images(raw_markdown, assets_dir)
-    (job_dir / "content.cleaned.md").write_text(cleaned_markdown, encoding="utf-8")
+    job_files = {job_dir / "content.cleaned.md": cleaned_markdown}
+    if settings.keep_original_md:
+        # Same bytes as Docling's content.md; only kept under the old name on request.
+        job_files[job_dir / "content.original.md"] = raw_markdown
+    await asyncio.to_thread(_write_job_files, job_files)
 
     logger.info("Docling extract completed for %s", job_id)
     return {
@@ -211,26 +336,27 @@ async def docling_extract(file: UploadFile = File(...)):
 
 
 @app.get("/docling/assets/{job_id}/{asset_path:path}")
-def docling_asset(job_id: str, asset_path: str):
-    job_dir = _resolve_docling_job(job_id)
-    assets_dir = job_dir / "assets"
+def docling_asset(request: Request, job_id: str, asset_path: str):
+    _resolve_docling_job(job_id)
     if not asset_path:
         raise HTTPException(status_code=404, detail="Asset not found")
-    candidate = (assets_dir / asset_path).resolve()
-    if (
-        not candidate.exists()
-        or not candidate.is_file()
-        or assets_dir.resolve() not in candidate.parents
-    ):
+    candidate = _resolve_docling_asset(job_id, asset_path)
+    stat_result = _regular_file_stat(candidate) if candidate is not None else None
+    if stat_result is None:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return FileResponse(candidate)
+    # Asset names are random per de-inlined image, so their content never changes.
+    return _conditional_file_response(
+        request,
+        candidate,
+        stat_result,
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
 
 
 @app.post("/docling/translate")
 async def docling_translate(payload: DoclingTranslateRequest):
     job_dir = _resolve_docling_job(payload.job_id)
-    edited_path = job_dir / "content.edited.md"
-    edited_path.write_text(payload.md, encoding="utf-8")
+    await asyncio.to_thread(_write_job_files, {job_dir / "content.edited.md": payload.md})
 
     if not _check_credible_api():
         logger.info("Docling translate skipped due to missing API credentials for %s", payload.job_id)
@@ -245,22 +371,17 @@ async def docling_translate(payload: DoclingTranslateRequest):
     if error or not translated_md:
         return {"translated_md": None, "error": error or NO_CREDIBLE_API}
 
-    (job_dir / "content.translated.md").write_text(translated_md, encoding="utf-8")
+    await asyncio.to_thread(_write_job_files, {job_dir / "content.translated.md": translated_md})
     logger.info("Docling translate completed for %s", payload.job_id)
     return {"translated_md": translated_md, "error": None}
 
 
-@app.post("/docling/render")
-async def docling_render(payload: DoclingRenderRequest):
-    job_dir = _resolve_docling_job(payload.job_id)
+def _render_docling_output(job_dir: Path, payload: DoclingRenderRequest, target: str) -> Path:
+    """Write ``content.latest.md`` and the rendered DOCX/PDF for a job; blocking."""
     assets_dir = job_dir / "assets"
     out_dir = job_dir / "out"
     out_dir.mkdir(parents=True, exist_ok=True)
-    (job_dir / "content.latest.md").write_text(payload.original_md, encoding="utf-8")
-
-    target = payload.target.lower()
-    if target not in {"docx", "pdf"}:
-        raise HTTPException(status_code=400, detail="target must be 'docx' or 'pdf'")
+    _write_job_files({job_dir / "content.latest.md": payload.original_md})
 
     lang_code = "fa" if payload.rtl else "en"
     assets_for_writer = assets_dir if _has_assets(assets_dir) else None
@@ -271,20 +392,11 @@ async def docling_render(payload: DoclingRenderRequest):
     def _ensure_combined_html() -> str:
         nonlocal combined_html
         if combined_html is None:
-            original_body = html_renderer.md_to_html(
+            original_body, translated_body = html_renderer.md_pair_to_html(
                 payload.original_md,
-                rtl=payload.rtl,
-                lang=lang_code,
-                wrap=False,
+                payload.translated_md,
             )
-            if payload.translated_md:
-                translated_body = html_renderer.md_to_html(
-                    payload.translated_md,
-                    rtl=payload.rtl,
-                    lang=lang_code,
-                    wrap=False,
-                )
-            else:
+            if translated_body is None:
                 translated_body = "<p><strong>NO credible API</strong></p>"
 
             combined_body = (
@@ -340,23 +452,60 @@ async def docling_render(payload: DoclingRenderRequest):
             assets_dir=assets_for_writer,
         )
 
+    return output_path
+
+
+@app.post("/docling/render")
+async def docling_render(payload: DoclingRenderRequest):
+    job_dir = _resolve_docling_job(payload.job_id)
+    target = payload.target.lower()
+    if target not in {"docx", "pdf"}:
+        raise HTTPException(status_code=400, detail="target must be 'docx' or 'pdf'")
+
+    output_path = await asyncio.to_thread(_render_docling_output, job_dir, payload, target)
+    _remember_docling_output(payload.job_id, output_path)
+
     logger.info("Docling render completed for %s (%s)", payload.job_id, target)
     return {
         "download": f"/docling/download/{payload.job_id}/{output_path.name}",
     }
 
 
+_DOCLING_OUTPUTS: Dict[tuple[str, str], Path] = {}
+_DOCLING_OUTPUTS_MAX = 1024
+
+
+def _remember_docling_output(job_id: str, output_path: Path) -> None:
+    """Record a freshly rendered output's path so downloads skip job resolution."""
+    key = (job_id, output_path.name)
+    _DOCLING_OUTPUTS.pop(key, None)
+    _DOCLING_OUTPUTS[key] = output_path
+    if len(_DOCLING_OUTPUTS) > _DOCLING_OUTPUTS_MAX:
+        _DOCLING_OUTPUTS.pop(next(iter(_DOCLING_OUTPUTS)))
+
+
 @app.get("/docling/download/{job_id}/{filename}")
-def download_docling_output(job_id: str, filename: str):
-    job_dir = _resolve_docling_job(job_id)
+def download_docling_output(request: Request, job_id: str, filename: str):
     candidate = Path(filename)
     if candidate.is_absolute() or ".." in candidate.parts:
         raise HTTPException(status_code=400, detail="invalid filename")
-    output_path = (job_dir / "out" / candidate).resolve()
-    out_dir = (job_dir / "out").resolve()
-    if not output_path.exists() or not output_path.is_file() or out_dir not in output_path.parents:
-        raise HTTPException(status_code=404, detail="File not found")
-    return FileResponse(output_path)
+    key = (job_id, filename)
+    output_path = _DOCLING_OUTPUTS.get(key)
+    if output_path is not None:
+        # Always stat afresh: the output may have been re-rendered or removed.
+        stat_result = _regular_file_stat(output_path)
+        if stat_result is None:
+            _DOCLING_OUTPUTS.pop(key, None)
+            raise HTTPException(status_code=404, detail="File not found")
+    else:
+        # Rendered by another worker or before a restart: validate and stat from disk.
+        job_dir = _resolve_docling_job(job_id)
+        output_path = (job_dir / "out" / candidate).resolve()
+        out_dir = (job_dir / "out").resolve()
+        stat_result = _regular_file_stat(output_path)
+        if stat_result is None or out_dir not in output_path.parents:
+            raise HTTPException(status_code=404, detail="File not found")
+    return _conditional_file_response(request, output_path, stat_result)
 
 # ---- schemas ----
 
@@ -408,42 +557,41 @@ def health():
 @app.post("/extract/url", response_model=ExtractResponse)
 def extract_from_url(req: ExtractUrlRequest):
     article_html = _extract_html_from_url(str(req.url))
-    ir = html_to_ir(article_html)
-    lang = detect_lang_doc(ir)
+    ir, lang = _analyze_html(article_html)
     # Return normalized HTML (not the raw page) so UI edits a clean structure
     content_html = ir_to_html(ir)
     return ExtractResponse(content_html=content_html, lang=lang)
 
 @app.post("/extract/file", response_model=Union[ExtractResponse, ExtractIRv2Response])
 async def extract_from_file(file: UploadFile = File(...), mode: str = Query("legacy", description="Mode: 'legacy' or 'irv2'")):
-    blob = await file.read()
-    
-    if mode == "irv2" and IRV2_AVAILABLE:
-        # Use IR v2 parsers
-        file_type = sniff_type(file.filename)
-        if file_type == "docx":
-            document, lang, stats = parse_docx(blob)
-            return ExtractIRv2Response(ir=document, lang=lang, stats=stats)
-        elif file_type == "pdf":
-            document, lang, stats = parse_pdf(blob)
-            return ExtractIRv2Response(ir=document, lang=lang, stats=stats)
-        else:
-            raise HTTPException(status_code=400, detail=f"IR v2 mode not supported for file type: {file_type}")
-    elif mode == "irv2" and not IRV2_AVAILABLE:
+    if mode == "irv2" and not IRV2_AVAILABLE:
         raise HTTPException(status_code=503, detail="IR v2 mode not available - missing dependencies")
-    else:
+
+    with tempfile.TemporaryDirectory(prefix="upload_") as tmp_dir:
+        upload_path = await _spool_upload(file, Path(tmp_dir) / f"source{Path(file.filename or '').suffix}")
+
+        if mode == "irv2":
+            # Use IR v2 parsers
+            file_type = sniff_type(file.filename)
+            if file_type == "docx":
+                document, lang, stats = await _run_parse(parse_docx, upload_path)
+                return ExtractIRv2Response(ir=document, lang=lang, stats=stats)
+            elif file_type == "pdf":
+                document, lang, stats = await _run_parse(parse_pdf, upload_path)
+                return ExtractIRv2Response(ir=document, lang=lang, stats=stats)
+            else:
+                raise HTTPException(status_code=400, detail=f"IR v2 mode not supported for file type: {file_type}")
+
         # Legacy mode
-        article_html = _extract_html_from_blob(file.filename, blob)
-        ir = html_to_ir(article_html)
-        lang = detect_lang_doc(ir)
-        content_html = ir_to_html(ir)
-        return ExtractResponse(content_html=content_html, lang=lang)
+        article_html = await _extract_html_from_blob(file.filename, upload_path)
+    ir, lang = _analyze_html(article_html)
+    content_html = ir_to_html(ir)
+    return ExtractResponse(content_html=content_html, lang=lang)
 
 @app.post("/translate", response_model=TranslateResponse)
 def translate(req: TranslateRequest):
     model = req.model or settings.model
-    ir = html_to_ir(req.content_html)
-    src_lang = detect_lang_doc(ir)
+    ir, src_lang = _analyze_html(req.content_html)
     if src_lang == "fa":
         # Already Persian; return as-is
         translated_ir = ir
@@ -452,6 +600,8 @@ def translate(req: TranslateRequest):
     translated_html = ir_to_html(translated_ir)
     return TranslateResponse(translated_html=translated_html, src_lang=src_lang)
 
+_DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
 @app.post("/report")
 def generate_report(req: ReportRequest):
     # Compose a simple document. Include translation section only when available.
@@ -465,12 +615,8 @@ def generate_report(req: ReportRequest):
     out_path = job / (req.filename if req.filename.endswith(".docx") else req.filename + ".docx")
     html_to_docx(composed_html, out_path)
 
-    # Stream back as attachment so the browser shows a Save dialog
-    bio = io.BytesIO(out_path.read_bytes())
-    headers = {
-        "Content-Disposition": f'attachment; filename="{out_path.name}"'
-    }
-    return StreamingResponse(bio, media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document", headers=headers)
+    # Serve straight from disk as an attachment so the browser shows a Save dialog
+    return FileResponse(out_path, media_type=_DOCX_MEDIA_TYPE, filename=out_path.name)
 
 @app.post("/report/irv2")
 def generate_report_irv2(req: ReportIRv2Request):
@@ -492,9 +638,8 @@ def generate_report_irv2(req: ReportIRv2Request):
     # Generate DOCX
     docx_bytes = write_docx(req.source_ir, target_ir, req.layout)
     
-    # Stream back as attachment
-    bio = io.BytesIO(docx_bytes)
+    # Return as attachment; the bytes are already in memory, so send them as-is
     headers = {
         "Content-Disposition": f'attachment; filename="{req.filename}"'
     }
-    return StreamingResponse(bio, media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document", headers=headers)
+    return Response(content=docx_bytes, media_type=_DOCX_MEDIA_TYPE, headers=headers)
@@ -1,6 +1,7 @@
-import typer, pathlib, sys, json, logging
+import typer, pathlib, sys, json, logging, glob
+from typing import List
 from logging_setup import setup_logging
-from pipeline import pipeline_url, pipeline_file
+from pipeline import pipeline_url, pipeline_file, pipeline_files
 from config import settings
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
@@ -47,5 +48,27 @@ def file(path: str,
     else:
         typer.echo(json.dumps(output, ensure_ascii=False, indent=2))
 
+@app.command(help="Translate several local files (paths or glob patterns) concurrently")
+def batch(paths: List[str],
+          out: str = typer.Option("terminal", "--out", help="terminal, docx, pdf, or html"),
+          dest: str = typer.Option(".", "--dest", help="Destination directory (for file outputs)"),
+          model: str = typer.Option(settings.model, "--model", help="OpenAI model name"),
+          glossary: str = typer.Option(None, "--glossary", help="Path to glossary JSON (optional)")):
+    # Expand patterns ourselves; cmd/PowerShell pass them through unexpanded
+    files = [f for p in paths for f in (sorted(glob.glob(p)) or [p])]
+    dest_path = pathlib.Path(dest).expanduser().resolve()
+    if out.lower() != "terminal":
+        dest_path.mkdir(parents=True, exist_ok=True)
+    glossary_dict = None
+    if glossary:
+        glossary_dict = json.loads(pathlib.Path(glossary).read_text(encoding="utf-8"))
+    outputs = pipeline_files(files, out_format=out, model=model, glossary=glossary_dict, dest_dir=dest_path)
+    if out.lower() == "terminal":
+        for path, output in zip(files, outputs):
+            print(f"==> {path} <==")
+            print(output if isinstance(output, str) else json.dumps(output, ensure_ascii=False, indent=2))
+    else:
+        typer.echo(json.dumps(outputs, ensure_ascii=False, indent=2))
+
 if __name__ == "__main__":
     app()
@@ -1,4 +1,5 @@
 # translator_agent/config.py
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,8 +16,11 @@ class Settings(BaseSettings):
     )
     max_chunk_tokens: int = 3000
     concurrency: int = 4
+    parse_workers: int = 2   # document parser processes
     out_format: str = "docx"   # or "pdf"
     fa_digits: bool = False
+    keep_original_md: bool = False   # also write content.original.md for docling jobs
+    translation_memory: Optional[str] = None   # SQLite TM path, e.g. data/translation_memory.sqlite3; unset disables
 
     # Pydantic v2 way to load .env
     model_config = SettingsConfigDict(
@@ -25,4 +29,14 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings (and read .env) once per process."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # `from config import settings` keeps working, but nothing is read until first use
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
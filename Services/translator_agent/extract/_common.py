@@ -0,0 +1,99 @@
+"""
+Heuristics shared by the IR v2 DOCX and PDF parsers.
+
+Prefix tables for the simple heading/list checks and the alphabet-based
+language guess, built once at import.
+"""
+
+import re
+from typing import Tuple
+
+from models.ir_v2 import Document as IRDocument
+
+
+_DIGIT_DOT_PREFIXES = tuple(f'{i}.' for i in range(1, 10))
+_ROMAN_DOT_PREFIXES = ('I.', 'II.', 'III.', 'IV.', 'V.', 'VI.', 'VII.', 'VIII.', 'IX.', 'X.')
+_LETTER_DOT_PREFIXES = tuple(f'{c}.' for c in 'ABCDEFGHIJ')
+_LETTER_PAREN_PREFIXES = tuple(f'{c})' for c in 'abcdefghij')
+_PAREN_DIGIT_PREFIXES = tuple(f'({i})' for i in range(1, 10))
+_PAREN_LETTER_PREFIXES = tuple(f'({c})' for c in 'abcdefghij')
+_CHAPTER_SECTION_PREFIXES = ('Chapter', 'CHAPTER', 'Section', 'SECTION')
+
+_HEADING_PREFIXES = (
+    ('Chapter', 'Section', 'Part', 'Appendix', 'CHAPTER', 'SECTION')
+    + _DIGIT_DOT_PREFIXES
+    + _ROMAN_DOT_PREFIXES
+    + _LETTER_DOT_PREFIXES
+    + _LETTER_PAREN_PREFIXES
+    + _PAREN_DIGIT_PREFIXES
+)
+# Pattern-based heading levels, checked in order.
+_HEADING_LEVEL_PREFIXES = (
+    (_CHAPTER_SECTION_PREFIXES, 1),
+    (_DIGIT_DOT_PREFIXES[:5], 1),
+    (_ROMAN_DOT_PREFIXES[:5], 2),
+    (_LETTER_DOT_PREFIXES[:5], 3),
+    (_LETTER_PAREN_PREFIXES[:5], 4),
+    (_PAREN_DIGIT_PREFIXES[:5], 4),
+)
+_HEADING_FIRST_CHARS = frozenset(p[0] for p in _HEADING_PREFIXES)
+
+_LIST_PREFIXES = (
+    ('•', '-', '*', '◦', '▪', '▫')
+    + _DIGIT_DOT_PREFIXES
+    + _LETTER_PAREN_PREFIXES
+    + _PAREN_LETTER_PREFIXES
+    + _PAREN_DIGIT_PREFIXES
+)
+_LIST_FIRST_CHARS = frozenset(p[0] for p in _LIST_PREFIXES)
+_ORDERED_LIST_PREFIXES = ('a)', 'b)', 'c)', 'i)', 'ii)', 'iii)')
+
+
+def _prefix_alternation(prefixes: Tuple[str, ...]) -> str:
+    return '|'.join(map(re.escape, prefixes))
+
+
+# One match answers both "has a heading prefix" and "which level": each level
+# group is tried in _HEADING_LEVEL_PREFIXES order, the remaining prefixes last.
+_HEADING_PREFIX_RE = re.compile('|'.join(
+    [f'({_prefix_alternation(prefixes)})' for prefixes, _ in _HEADING_LEVEL_PREFIXES]
+    + [f'(?:{_prefix_alternation(_HEADING_PREFIXES)})']
+))
+_HEADING_GROUP_LEVELS = (None,) + tuple(level for _, level in _HEADING_LEVEL_PREFIXES)
+_LIST_PREFIX_RE = re.compile(_prefix_alternation(_LIST_PREFIXES))
+
+
+# Alphabets checked in priority order; frozensets let isdisjoint() scan the sample in C.
+_LANGUAGE_ALPHABETS = (
+    ('fa', frozenset('ابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی')),  # Persian
+    ('ru', frozenset('абвгдеёжзийклмнопрстуфхцчшщъыьэюя')),  # Russian
+    ('fr', frozenset('àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ')),  # French
+    ('de', frozenset('äöüß')),  # German
+)
+_LANGUAGE_SAMPLE_CHARS = 1000
+
+
+def _detect_language(doc: IRDocument) -> str:
+    """Detect document language (simple heuristic)."""
+    # Extract text until the sample is full
+    all_text = []
+    collected = 0
+    for section in doc.sections:
+        for block in section.blocks:
+            # Paragraph, Heading and ListItem expose .text; tables and figures carry none
+            text = getattr(block, 'text', '')
+            if text:
+                all_text.append(text)
+                collected += len(text) + 1
+            if collected >= _LANGUAGE_SAMPLE_CHARS:
+                break
+        if collected >= _LANGUAGE_SAMPLE_CHARS:
+            break
+
+    text_sample = ' '.join(all_text)[:_LANGUAGE_SAMPLE_CHARS]  # First 1000 chars
+
+    # Simple heuristics
+    for lang, alphabet in _LANGUAGE_ALPHABETS:
+        if not alphabet.isdisjoint(text_sample):
+            return lang
+    return 'en'  # Default to English
@@ -1,16 +1,26 @@
 # translator_agent/extract/docx_parser.py
 import io
-import mammoth
+from pathlib import Path
+from typing import BinaryIO, Union
 
-def docx_to_html(blob: bytes) -> str:
+
+def _open_source(source: Union[bytes, str, Path]) -> BinaryIO:
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return open(source, "rb")
+
+
+def docx_to_html(source: Union[bytes, str, Path]) -> str:
     """
-    Convert a DOCX (bytes) to simple HTML.
+    Convert a DOCX (bytes or path on disk) to simple HTML.
     Primary path: Mammoth (great at mapping Word styles to semantic HTML).
     Fallback: python-docx -> naive HTML if Mammoth fails.
     """
-    # 1) Mammoth needs a file-like object (seek/read)
+    # 1) Mammoth needs a file-like object (seek/read); imported here since it is only needed for DOCX
     try:
-        with io.BytesIO(blob) as fp:
+        import mammoth
+
+        with _open_source(source) as fp:
             result = mammoth.convert_to_html(fp)
         html = result.value
         if html and html.strip():
@@ -23,7 +33,7 @@ def docx_to_html(blob: bytes) -> str:
         from docx import Document
         from html import escape
 
-        with io.BytesIO(blob) as fp:
+        with _open_source(source) as fp:
             doc = Document(fp)
 
         parts = []
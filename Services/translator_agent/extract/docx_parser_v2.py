@@ -7,7 +7,8 @@ formatting, and layout information in the IR v2 format.
 
 import io
 import re
-from typing import List, Dict, Optional, Tuple
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from docx import Document
 from docx.document import Document as DocumentType
 from docx.oxml.table import CT_Tbl
@@ -18,8 +19,9 @@ from docx.table import Table as DocxTable
 from docx.text.paragraph import Paragraph as DocxParagraph
 from docx.text.run import Run as DocxRun
 from docx.oxml import parse_xml
-from docx.oxml.ns import nsdecls
+from docx.oxml.ns import nsdecls, nsmap, qn
 from docx.oxml import OxmlElement
+from lxml import etree
 
 from models.ir_v2 import (
     Document as IRDocument,
@@ -41,20 +43,58 @@ from models.ir_v2 import (
     ParseResult,
     Block
 )
+from extract._common import (
+    _HEADING_FIRST_CHARS,
+    _HEADING_GROUP_LEVELS,
+    _HEADING_PREFIX_RE,
+    _LIST_FIRST_CHARS,
+    _LIST_PREFIX_RE,
+    _ORDERED_LIST_PREFIXES,
+    _detect_language,
+)
+
+
+# Same inner-content elements python-docx joins for Run.text / Paragraph.text, but as
+# precompiled XPath instead of a fresh xpath() compile per run.
+_RUN_TEXT_NODES = "*[self::w:br or self::w:cr or self::w:noBreakHyphen or self::w:ptab or self::w:t or self::w:tab]"
+_RUN_TEXT_XPATH = etree.XPath(_RUN_TEXT_NODES, namespaces={"w": nsmap["w"]})
+_PARAGRAPH_TEXT_XPATH = etree.XPath(
+    f"(w:r | w:hyperlink/w:r)/{_RUN_TEXT_NODES}", namespaces={"w": nsmap["w"]}
+)
+_W_T = qn("w:t")
+_W_P = qn("w:p")
+
+
+def _join_text_nodes(nodes) -> str:
+    # w:t carries its text directly; the other elements stringify to their equivalent (tab, newline, ...)
+    return "".join((node.text or "") if node.tag == _W_T else str(node) for node in nodes)
+
 
+def _run_text(run: DocxRun) -> str:
+    """``run.text`` equivalent using the precompiled XPath."""
+    return _join_text_nodes(_RUN_TEXT_XPATH(run._r))
 
-def parse_docx(file_bytes: bytes) -> Tuple[IRDocument, str, Dict]:
+
+def _paragraph_text(p: CT_P) -> str:
+    """``Paragraph.text`` equivalent (including hyperlink runs) for a ``w:p`` element."""
+    return _join_text_nodes(_PARAGRAPH_TEXT_XPATH(p))
+
+
+def parse_docx(source: Union[bytes, str, Path]) -> Tuple[IRDocument, str, Dict]:
     """
     Parse a DOCX file and return IR v2 document, language, and stats.
     
     Args:
-        file_bytes: Raw DOCX file bytes
+        source: Raw DOCX file bytes or a path to the DOCX file on disk
         
     Returns:
         Tuple of (Document, language, stats_dict)
     """
-    with io.BytesIO(file_bytes) as fp:
-        doc = Document(fp)
+    if isinstance(source, (bytes, bytearray)):
+        with io.BytesIO(source) as fp:
+            doc = Document(fp)
+    else:
+        doc = Document(str(source))
     
     # Initialize stats
     stats = TranslationStats()
@@ -81,11 +121,14 @@ def _extract_metadata(doc: DocumentType) -> DocumentMeta:
     """Extract document metadata."""
     core_props = doc.core_properties
     
+    paragraphs = list(doc.element.body.iterchildren(_W_P))
+
     # Count pages (rough estimate)
-    page_count = len(doc.paragraphs) // 20  # Rough estimate
+    page_count = len(paragraphs) // 20  # Rough estimate
     
-    # Count words
-    word_count = sum(len(p.text.split()) for p in doc.paragraphs)
+    # Count words with a single split over all paragraph text; the newline
+    # separator keeps words in adjacent paragraphs from merging.
+    word_count = len("\n".join(_paragraph_text(p) for p in paragraphs).split())
     
     return DocumentMeta(
         title=core_props.title or None,
@@ -100,26 +143,31 @@ def _extract_metadata(doc: DocumentType) -> DocumentMeta:
 def _parse_sections(doc: DocumentType, stats: TranslationStats) -> List[Section]:
     """Parse document sections with simple, reliable text extraction."""
     blocks = []
-    
-    # Simple approach: process all paragraphs in order
-    for para in doc.paragraphs:
-        if para.text.strip():
-            block = _parse_paragraph_simple(para)
+    paragraph_count = 0
+    table_count = 0
+    style_names: Dict[Optional[str], str] = {}
+    
+    # Single walk over the body in document order, so tables stay where they appear
+    for child in doc.element.body.iterchildren():
+        if isinstance(child, CT_P):
+            block = _parse_paragraph_simple(DocxParagraph(child, doc), style_names)
+            if isinstance(block, Paragraph):
+                paragraph_count += 1
+        elif isinstance(child, CT_Tbl):
+            block = _parse_table_simple(DocxTable(child, doc))
             if block:
-                blocks.append(block)
-    
-    # Process all tables
-    for table in doc.tables:
-        table_block = _parse_table_simple(table)
-        if table_block:
-            blocks.append(table_block)
+                table_count += 1
+        else:
+            continue
+        if block:
+            blocks.append(block)
     
     # Group blocks into logical sections based on headings
     sections = _group_into_sections_simple(blocks)
     
     # Update stats
-    stats.paragraphs = len([b for b in blocks if isinstance(b, Paragraph)])
-    stats.tables = len([b for b in blocks if isinstance(b, Table)])
+    stats.paragraphs = paragraph_count
+    stats.tables = table_count
     stats.sections = len(sections)
 
     if not sections:
@@ -144,15 +192,32 @@ def _parse_sections(doc: DocumentType, stats: TranslationStats) -> List[Section]
     return sections
 
 
-def _parse_paragraph_simple(para: DocxParagraph) -> Optional[Block]:
+_HEADING_STYLE_LEVELS = tuple((f'heading {i}', i) for i in range(2, 7))
+
+
+def _style_name(para: DocxParagraph, style_names: Dict[Optional[str], str]) -> str:
+    """
+    Lower-cased paragraph style name, memoised per style id.
+
+    ``para.style`` rescans every style in the document to find the default on each
+    call, which dominates parse time on long documents.
+    """
+    style_id = para._p.style
+    name = style_names.get(style_id)
+    if name is None:
+        name = style_names[style_id] = para.style.name.lower()
+    return name
+
+
+def _parse_paragraph_simple(para: DocxParagraph, style_names: Dict[Optional[str], str]) -> Optional[Block]:
     """Parse a paragraph using simple, reliable heuristics."""
-    text = para.text.strip()
+    text = _paragraph_text(para._p).strip()
     if not text:
         return None
     
     # Simple heading detection
-    if _is_simple_heading_docx(text, para):
-        level = _get_simple_heading_level_docx(text, para)
+    level = _get_simple_heading_level_docx(text, _style_name(para, style_names))
+    if level is not None:
         spans = _extract_spans_simple(para)
         return Heading(level=level, spans=spans)
     
@@ -168,81 +233,51 @@ def _parse_paragraph_simple(para: DocxParagraph) -> Optional[Block]:
     return Paragraph(spans=spans)
 
 
-def _is_simple_heading_docx(text: str, para: DocxParagraph) -> bool:
-    """Simple heading detection for DOCX."""
-    # Check style first
-    style_name = para.style.name.lower()
-    if any(keyword in style_name for keyword in ['heading', 'title']):
-        return True
-    
-    # Check for obvious heading patterns
-    heading_patterns = [
-        text.startswith(('Chapter', 'Section', 'Part', 'Appendix', 'CHAPTER', 'SECTION')),
-        text.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')),
-        text.startswith(('I.', 'II.', 'III.', 'IV.', 'V.', 'VI.', 'VII.', 'VIII.', 'IX.', 'X.')),
-        text.startswith(('A.', 'B.', 'C.', 'D.', 'E.', 'F.', 'G.', 'H.', 'I.', 'J.')),
-        text.startswith(('a)', 'b)', 'c)', 'd)', 'e)', 'f)', 'g)', 'h)', 'i)', 'j)')),
-        text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)', '(6)', '(7)', '(8)', '(9)')),
+def _get_simple_heading_level_docx(text: str, style_name: str) -> Optional[int]:
+    """
+    Simple heading detection for DOCX: return the heading level, or ``None``
+    when the paragraph does not look like a heading.
+
+    ``text`` must be stripped and non-empty; ``style_name`` already lower-cased.
+    """
+    prefix_match = _HEADING_PREFIX_RE.match(text) if text[0] in _HEADING_FIRST_CHARS else None
+    has_prefix = prefix_match is not None
+    is_heading = (
+        # Check style first
+        'heading' in style_name or 'title' in style_name
+        # Check for obvious heading patterns
+        or has_prefix
         # Short lines that could be headings
-        len(text) < 80 and not text.endswith('.') and not text.endswith(','),
+        or (len(text) < 80 and not text.endswith(('.', ',')))
         # All caps short lines
-        text.isupper() and len(text) < 100,
-    ]
-    
-    return any(heading_patterns)
-
+        or (text.isupper() and len(text) < 100)
+    )
+    if not is_heading:
+        return None
 
-def _get_simple_heading_level_docx(text: str, para: DocxParagraph) -> int:
-    """Simple heading level detection for DOCX."""
-    # Check style first
-    style_name = para.style.name.lower()
+    # Style-based level
     if 'heading 1' in style_name or 'title' in style_name:
         return 1
-    elif 'heading 2' in style_name:
-        return 2
-    elif 'heading 3' in style_name:
-        return 3
-    elif 'heading 4' in style_name:
-        return 4
-    elif 'heading 5' in style_name:
-        return 5
-    elif 'heading 6' in style_name:
-        return 6
-    
+    for style_prefix, level in _HEADING_STYLE_LEVELS:
+        if style_prefix in style_name:
+            return level
+
     # Pattern-based detection
-    if text.startswith(('Chapter', 'CHAPTER', 'Section', 'SECTION')):
-        return 1
-    elif text.startswith(('1.', '2.', '3.', '4.', '5.')):
+    if has_prefix and prefix_match.lastindex:
+        return _HEADING_GROUP_LEVELS[prefix_match.lastindex]
+
+    # Default based on length
+    if len(text) < 30:
         return 1
-    elif text.startswith(('I.', 'II.', 'III.', 'IV.', 'V.')):
+    elif len(text) < 50:
         return 2
-    elif text.startswith(('A.', 'B.', 'C.', 'D.', 'E.')):
-        return 3
-    elif text.startswith(('a)', 'b)', 'c)', 'd)', 'e)')):
-        return 4
-    elif text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)')):
-        return 4
     else:
-        # Default based on length
-        if len(text) < 30:
-            return 1
-        elif len(text) < 50:
-            return 2
-        else:
-            return 3
+        return 3
 
 
 def _is_simple_list_item_docx(text: str) -> bool:
     """Simple list item detection for DOCX."""
-    list_patterns = [
-        text.startswith(('•', '-', '*', '◦', '▪', '▫')),
-        text.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')),
-        text.startswith(('a)', 'b)', 'c)', 'd)', 'e)', 'f)', 'g)', 'h)', 'i)', 'j)')),
-        text.startswith(('(a)', '(b)', '(c)', '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)')),
-        text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)', '(6)', '(7)', '(8)', '(9)')),
-    ]
-    
-    return any(list_patterns)
+    return text[0] in _LIST_FIRST_CHARS and _LIST_PREFIX_RE.match(text) is not None
 
 
 def _get_simple_list_level_docx(text: str) -> int:
@@ -258,15 +293,31 @@ def _get_simple_list_level_docx(text: str) -> int:
 def _is_simple_ordered_list_docx(text: str) -> bool:
     """Simple ordered list detection for DOCX."""
     return (text[0].isdigit() and '.' in text[:5]) or \
-           text.startswith(('a)', 'b)', 'c)', 'i)', 'ii)', 'iii)'))
+           text.startswith(_ORDERED_LIST_PREFIXES)
 
 
 def _extract_spans_simple(para: DocxParagraph) -> List[Span]:
     """Extract spans with simple formatting detection."""
+    runs = para.runs
+
+    # Most body paragraphs are a single run: skip the loop and list building
+    if len(runs) == 1:
+        run = runs[0]
+        text = _normalize_text(_run_text(run))
+        if text:
+            return [Span(
+                text=text,
+                bold=run.bold,
+                italic=run.italic,
+                underline=run.underline is not None
+            )]
+        fallback_text = _normalize_text(_paragraph_text(para._p))
+        return [Span(text=fallback_text)] if fallback_text else []
+
     spans = []
     
-    for run in para.runs:
-        text = _normalize_text(run.text)
+    for run in runs:
+        text = _normalize_text(_run_text(run))
         if not text:
             continue
             
@@ -280,7 +331,7 @@ def _extract_spans_simple(para: DocxParagraph) -> List[Span]:
     
     # If no spans, create one with plain text
     if not spans:
-        fallback_text = _normalize_text(para.text)
+        fallback_text = _normalize_text(_paragraph_text(para._p))
         if fallback_text:
             spans.append(Span(text=fallback_text))
     
@@ -312,260 +363,26 @@ def _parse_table_simple(table: DocxTable) -> Optional[Table]:
 
 def _group_into_sections_simple(blocks: List[Block]) -> List[Section]:
     """Group blocks into logical sections with simple heuristics."""
-    sections = []
-    current_section_blocks = []
-    section_index = 0
-    
-    for block in blocks:
-        # If we encounter a major heading, start a new section
-        if isinstance(block, Heading) and block.level <= 2:
-            # Save previous section if it has content
-            if current_section_blocks:
-                sections.append(Section(
-                    index=section_index,
-                    blocks=current_section_blocks
-                ))
-                section_index += 1
-                current_section_blocks = []
-        
-        current_section_blocks.append(block)
-    
-    # Add the last section
-    if current_section_blocks:
-        sections.append(Section(
-            index=section_index,
-            blocks=current_section_blocks
-        ))
-    
-    # If no sections were created, create one with all blocks
-    if not sections:
-        sections = [Section(index=0, blocks=blocks)]
-    
-    return sections
+    return list(_iter_sections_simple(blocks)) or [Section(index=0, blocks=[])]
 
 
-def _group_into_sections(blocks: List[Block]) -> List[Section]:
-    """Group blocks into logical sections based on headings."""
-    sections = []
-    current_section_blocks = []
+def _iter_sections_simple(blocks: List[Block]) -> Iterator[Section]:
+    """Yield sections in a single pass, starting a new one at each major heading."""
+    current_section_blocks: List[Block] = []
     section_index = 0
     
     for block in blocks:
-        # If we encounter a major heading, start a new section
-        if isinstance(block, Heading) and block.level <= 2:
-            # Save previous section if it has content
-            if current_section_blocks:
-                sections.append(Section(
-                    index=section_index,
-                    blocks=current_section_blocks
-                ))
-                section_index += 1
-                current_section_blocks = []
+        # If we encounter a major heading, start a new section.
+        if type(block) is Heading and block.level <= 2 and current_section_blocks:
+            yield Section(index=section_index, blocks=current_section_blocks)
+            section_index += 1
+            current_section_blocks = []
         
         current_section_blocks.append(block)
     
     # Add the last section
     if current_section_blocks:
-        sections.append(Section(
-            index=section_index,
-            blocks=current_section_blocks
-        ))
-    
-    # If no sections were created, create one with all blocks
-    if not sections:
-        sections = [Section(index=0, blocks=blocks)]
-    
-    return sections
-
-
-def _parse_paragraph_improved(para: DocxParagraph, list_level: int = 0, in_list: bool = False) -> Optional[Block]:
-    """Parse a paragraph with improved structure detection."""
-    if not para.text.strip():
-        return None
-    
-    # Check if it's a heading with improved detection
-    heading_level = _get_heading_level_improved(para)
-    if heading_level:
-        spans = _extract_spans_improved(para)
-        return Heading(level=heading_level, spans=spans)
-    
-    # Check if it's a list item with improved detection
-    if _is_list_item_improved(para):
-        spans = _extract_spans_improved(para)
-        ordered = _is_ordered_list_improved(para)
-        return ListItem(level=list_level, ordered=ordered, spans=spans)
-    
-    # Regular paragraph
-    spans = _extract_spans_improved(para)
-    return Paragraph(spans=spans)
-
-
-def _get_heading_level_improved(para: DocxParagraph) -> Optional[int]:
-    """Improved heading level detection."""
-    style_name = para.style.name.lower()
-    
-    # Check for explicit heading styles
-    if 'heading 1' in style_name or 'title' in style_name:
-        return 1
-    elif 'heading 2' in style_name:
-        return 2
-    elif 'heading 3' in style_name:
-        return 3
-    elif 'heading 4' in style_name:
-        return 4
-    elif 'heading 5' in style_name:
-        return 5
-    elif 'heading 6' in style_name:
-        return 6
-    
-    # Check for implicit heading patterns
-    text = para.text.strip()
-    if text.startswith(('Chapter', 'Section', 'Part', 'Appendix')):
-        return 1
-    elif text.startswith(('1.', '2.', '3.', '4.', '5.')):
-        return 1
-    elif text.startswith(('I.', 'II.', 'III.', 'IV.', 'V.')):
-        return 2
-    elif text.startswith(('A.', 'B.', 'C.', 'D.', 'E.')):
-        return 3
-    
-    # Check font size (if available)
-    try:
-        if para.runs:
-            font_size = para.runs[0].font.size
-            if font_size and font_size.pt > 16:
-                return 1
-            elif font_size and font_size.pt > 14:
-                return 2
-            elif font_size and font_size.pt > 12:
-                return 3
-    except:
-        pass
-    
-    return None
-
-
-def _is_list_item_improved(para: DocxParagraph) -> bool:
-    """Improved list item detection."""
-    # Check for list numbering or bullet points
-    style_name = para.style.name.lower()
-    
-    # Check style-based lists
-    if any(keyword in style_name for keyword in ['list', 'bullet', 'number']):
-        return True
-    
-    # Check for list numbering in paragraph
-    if para._element.getparent().tag.endswith('numPr'):
-        return True
-    
-    # Check for common list patterns
-    text = para.text.strip()
-    list_patterns = [
-        text.startswith(('•', '-', '*', '◦', '▪')),
-        text.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')),
-        text.startswith(('a)', 'b)', 'c)', 'd)', 'e)', 'f)', 'g)', 'h)', 'i)', 'j)')),
-        text.startswith(('(a)', '(b)', '(c)', '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)')),
-        text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)', '(6)', '(7)', '(8)', '(9)')),
-    ]
-    
-    return any(list_patterns)
-
-
-def _is_ordered_list_improved(para: DocxParagraph) -> bool:
-    """Improved ordered list detection."""
-    text = para.text.strip()
-    
-    # Check for numbered patterns
-    if text[0].isdigit() and '.' in text[:5]:
-        return True
-    
-    # Check for letter patterns
-    if text.startswith(('a)', 'b)', 'c)', 'i)', 'ii)', 'iii)')):
-        return True
-    
-    # Check for parenthesized patterns
-    if text.startswith(('(1)', '(2)', '(3)', '(a)', '(b)', '(c)')):
-        return True
-    
-    return False
-
-
-def _extract_spans_improved(para: DocxParagraph) -> List[Span]:
-    """Extract formatted spans with improved detection."""
-    spans = []
-    
-    for run in para.runs:
-        text = _normalize_text(run.text)
-        if not text:
-            continue
-            
-        span = Span(
-            text=text,
-            bold=run.bold,
-            italic=run.italic,
-            underline=run.underline is not None,
-            link=_extract_link_improved(run)
-        )
-        spans.append(span)
-    
-    # If no spans, create one with plain text
-    if not spans:
-        fallback_text = _normalize_text(para.text)
-        if fallback_text:
-            spans.append(Span(text=fallback_text))
-    
-    return spans
-
-
-def _extract_link_improved(run: DocxRun) -> Optional[str]:
-    """Extract hyperlink with improved detection."""
-    try:
-        # Check if run has hyperlink
-        for element in run._element:
-            if element.tag.endswith('hyperlink'):
-                r_id = element.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
-                if r_id:
-                    return f"#link_{r_id}"
-    except:
-        pass
-    return None
-
-
-def _parse_table_improved(table: DocxTable) -> Optional[Table]:
-    """Parse a table with improved structure detection."""
-    if not table.rows:
-        return None
-    
-    rows = []
-    for docx_row in table.rows:
-        cells = []
-        for cell in docx_row.cells:
-            # Parse cell content with improved detection
-            cell_blocks = []
-            for para in cell.paragraphs:
-                if para.text.strip():
-                    # Determine if cell content is a heading, list, or paragraph
-                    if _get_heading_level_improved(para):
-                        level = _get_heading_level_improved(para)
-                        spans = _extract_spans_improved(para)
-                        cell_blocks.append(Heading(level=level, spans=spans))
-                    elif _is_list_item_improved(para):
-                        spans = _extract_spans_improved(para)
-                        ordered = _is_ordered_list_improved(para)
-                        cell_blocks.append(ListItem(level=0, ordered=ordered, spans=spans))
-                    else:
-                        spans = _extract_spans_improved(para)
-                        cell_blocks.append(Paragraph(spans=spans))
-            
-            # If no blocks, create empty paragraph
-            if not cell_blocks:
-                cell_blocks.append(Paragraph(spans=[Span(text="")]))
-            
-            cells.append(Cell(blocks=cell_blocks))
-        
-        rows.append(Row(cells=cells))
-    
-    return Table(rows=rows)
+        yield Section(index=section_index, blocks=current_section_blocks)
 
 
 def _parse_paragraph(para: DocxParagraph, list_level: int = 0, in_list: bool = False) -> Optional[Block]:
@@ -668,34 +485,6 @@ def _extract_link(run: DocxRun) -> Optional[str]:
     return None
 
 
-def _parse_table(table: DocxTable) -> Optional[Table]:
-    """Parse a table into IR v2 format."""
-    if not table.rows:
-        return None
-    
-    rows = []
-    for docx_row in table.rows:
-        cells = []
-        for cell in docx_row.cells:
-            # Parse cell content
-            cell_blocks = []
-            for para in cell.paragraphs:
-                if para.text.strip():
-                    block = _parse_paragraph(para)
-                    if block:
-                        cell_blocks.append(block)
-            
-            # If no blocks, create empty paragraph
-            if not cell_blocks:
-                cell_blocks.append(Paragraph(spans=[Span(text="")]))
-            
-            cells.append(Cell(blocks=cell_blocks))
-        
-        rows.append(Row(cells=cells))
-    
-    return Table(rows=rows)
-
-
 def _parse_header_footer_part(part) -> List[Block]:
     """Parse header or footer content and return IR blocks."""
     if part is None:
@@ -709,35 +498,17 @@ def _parse_header_footer_part(part) -> List[Block]:
     return blocks
 
 
+_LINEBREAK_RE = re.compile(r'[\r\n\v]+')
+_MULTISPACE_RE = re.compile(r' {2,}')
+
+
 def _normalize_text(text: Optional[str]) -> str:
     """Normalize run text by removing line breaks that fragment paragraphs."""
     if not text:
         return ""
-    cleaned = re.sub(r'[\r\n\v]+', ' ', text)
-    cleaned = re.sub(r' {2,}', ' ', cleaned)
+    # Most runs are already clean; skip both substitutions for them.
+    if '\n' not in text and '\r' not in text and '\v' not in text and '  ' not in text:
+        return text.strip()
+    cleaned = _LINEBREAK_RE.sub(' ', text)
+    cleaned = _MULTISPACE_RE.sub(' ', cleaned)
     return cleaned.strip()
-
-
-def _detect_language(doc: IRDocument) -> str:
-    """Detect document language (simple heuristic)."""
-    # Extract all text
-    all_text = []
-    for section in doc.sections:
-        for block in section.blocks:
-            if isinstance(block, (Paragraph, Heading, ListItem)):
-                for span in getattr(block, 'spans', []):
-                    all_text.append(span.text)
-    
-    text_sample = ' '.join(all_text)[:1000]  # First 1000 chars
-    
-    # Simple heuristics
-    if any(char in text_sample for char in 'ابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی'):
-        return 'fa'  # Persian
-    elif any(char in text_sample for char in 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'):
-        return 'ru'  # Russian
-    elif any(char in text_sample for char in 'àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ'):
-        return 'fr'  # French
-    elif any(char in text_sample for char in 'äöüß'):
-        return 'de'  # German
-    else:
-        return 'en'  # Default to English
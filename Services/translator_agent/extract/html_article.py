@@ -1,14 +1,22 @@
 # translator_agent/extract/html_article.py
-from readability import Document
-import trafilatura
+from functools import lru_cache
 
+from lxml import etree
+from lxml import html as lxml_html
+
+@lru_cache(maxsize=32)
 def extract_main_article_html(html: str, base_url: str | None = None) -> str:
     """
     Return main-article HTML. Prefer readability (HTML), fallback to trafilatura (plain text -> simple HTML),
     finally fall back to the original HTML if both fail.
+
+    Memoized on (html, base_url), so re-fetching an unchanged page skips both extractors.
     """
-    # 1) Primary: readability -> HTML
+    # 1) Primary: readability -> HTML (readability and trafilatura are imported on first
+    # use; together they add well over 100 ms to importing this module)
     try:
+        from readability import Document
+
         doc = Document(html)
         summary_html = doc.summary(html_partial=True)  # already HTML
         # crude length check to avoid boilerplate
@@ -19,6 +27,8 @@ def extract_main_article_html(html: str, base_url: str | None = None) -> str:
 
     # 2) Fallback: trafilatura -> plain text -> wrap as <p>
     try:
+        import trafilatura
+
         txt = trafilatura.extract(
             html,
             url=base_url,
@@ -37,9 +47,7 @@ def extract_main_article_html(html: str, base_url: str | None = None) -> str:
 
 
 def _text_only(fragment_html: str) -> str:
-    """Remove tags to approximate text length without extra deps."""
-    import re
-    s = re.sub(r"(?is)<script.*?>.*?</script>", "", fragment_html)
-    s = re.sub(r"(?is)<style.*?>.*?</style>", "", s)
-    s = re.sub(r"(?is)<[^>]+>", "", s)
-    return s
+    """Text content of an HTML fragment (scripts/styles dropped) to approximate its length."""
+    root = lxml_html.fragment_fromstring(fragment_html, create_parent="div")
+    etree.strip_elements(root, "script", "style", with_tail=False)
+    return root.text_content()
@@ -1,15 +1,21 @@
+import html
+from pathlib import Path
 from typing import List, Union
-import fitz  # PyMuPDF
 
-def pdf_to_html_like(blob: bytes) -> str:
+def pdf_to_html_like(source: Union[bytes, str, Path]) -> str:
     # Very simple HTML-like wrapper that keeps paragraphs per page
-    doc = fitz.open(stream=blob, filetype="pdf")
+    import fitz  # PyMuPDF; imported here since it is only needed for PDFs
+    if isinstance(source, (bytes, bytearray)):
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(str(source), filetype="pdf")
     parts = []
-    for page in doc:
-        text = page.get_text("text")
-        # naive paragraph split
-        paras = [p.strip() for p in text.split("\n\n") if p.strip()]
-        parts.append("<h2>Page {}</h2>".format(page.number + 1))
-        for p in paras:
-            parts.append("<p>{}</p>".format(p.replace("&","&amp;").replace("<","&lt;").replace(">","&gt;")))
+    with doc:
+        for page in doc:
+            text = page.get_text("text")
+            # naive paragraph split
+            paras = [p.strip() for p in text.split("\n\n") if p.strip()]
+            parts.append("<h2>Page {}</h2>".format(page.number + 1))
+            for p in paras:
+                parts.append("<p>{}</p>".format(html.escape(p, quote=False)))
     return "\n".join(parts)
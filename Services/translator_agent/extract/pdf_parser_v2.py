@@ -6,7 +6,12 @@ formatting, and layout information in the IR v2 format.
 """
 
 import io
-from typing import List, Dict, Optional, Tuple, Set
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set, Union
 import fitz  # PyMuPDF
 from collections import defaultdict, Counter
 
@@ -30,19 +35,64 @@ from models.ir_v2 import (
     ParseResult,
     Block
 )
+from extract._common import (
+    _CHAPTER_SECTION_PREFIXES,
+    _DIGIT_DOT_PREFIXES,
+    _HEADING_FIRST_CHARS,
+    _HEADING_GROUP_LEVELS,
+    _HEADING_PREFIX_RE,
+    _LETTER_DOT_PREFIXES,
+    _LETTER_PAREN_PREFIXES,
+    _LIST_FIRST_CHARS,
+    _LIST_PREFIX_RE,
+    _ORDERED_LIST_PREFIXES,
+    _PAREN_DIGIT_PREFIXES,
+    _ROMAN_DOT_PREFIXES,
+    _detect_language,
+)
+
+
+# Page-level parallelism: below this many pages the worker start-up costs more than it saves.
+_PARALLEL_MIN_PAGES = 8
+_PAGE_WORKERS = min(os.cpu_count() or 1, 4)
+_PAGE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _page_pool() -> ProcessPoolExecutor:
+    global _PAGE_POOL
+    if _PAGE_POOL is None:
+        _PAGE_POOL = ProcessPoolExecutor(max_workers=_PAGE_WORKERS)
+    return _PAGE_POOL
+
+
+def _can_parallelize(source: Optional[Union[bytes, str, Path]], page_count: int) -> bool:
+    # Workers reopen the file by path (never ship the bytes), and pools are not
+    # nested when parse_pdf itself runs inside a worker process.
+    return (
+        isinstance(source, (str, Path))
+        and _PAGE_WORKERS > 1
+        and page_count >= _PARALLEL_MIN_PAGES
+        and multiprocessing.parent_process() is None
+    )
+
+
+def _open_pdf(source: Union[bytes, str, Path]) -> fitz.Document:
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(str(source), filetype="pdf")
 
 
-def parse_pdf(file_bytes: bytes) -> Tuple[IRDocument, str, Dict]:
+def parse_pdf(source: Union[bytes, str, Path]) -> Tuple[IRDocument, str, Dict]:
     """
     Parse a PDF file and return IR v2 document, language, and stats.
     
     Args:
-        file_bytes: Raw PDF file bytes
+        source: Raw PDF file bytes or a path to the PDF file on disk
         
     Returns:
         Tuple of (Document, language, stats_dict)
     """
-    doc = fitz.open(stream=file_bytes, filetype="pdf")
+    doc = _open_pdf(source)
     
     # Initialize stats
     stats = TranslationStats()
@@ -50,8 +100,8 @@ def parse_pdf(file_bytes: bytes) -> Tuple[IRDocument, str, Dict]:
     # Parse document metadata
     meta = _extract_metadata(doc)
     
-    # Parse pages and extract content
-    sections = _parse_pages(doc, stats)
+    # Parse pages and extract content; words are counted from the same text blocks
+    sections, meta.word_count = _parse_pages(doc, stats, source)
     
     # Create document
     ir_doc = IRDocument(meta=meta, sections=sections)
@@ -73,11 +123,8 @@ def _extract_metadata(doc: fitz.Document) -> DocumentMeta:
     # Count pages
     page_count = doc.page_count
     
-    # Count words (rough estimate)
+    # Words are counted while _parse_pages walks the text blocks
     word_count = 0
-    for page in doc:
-        text = page.get_text()
-        word_count += len(text.split())
     
     return DocumentMeta(
         title=metadata.get('title') or None,
@@ -89,21 +136,35 @@ def _extract_metadata(doc: fitz.Document) -> DocumentMeta:
     )
 
 
-def _parse_pages(doc: fitz.Document, stats: TranslationStats) -> List[Section]:
-    """Parse PDF pages into sections with improved structure detection."""
+def _parse_pages(doc: fitz.Document, stats: TranslationStats,
+                 source: Optional[Union[bytes, str, Path]] = None) -> Tuple[List[Section], int]:
+    """Parse PDF pages into sections with improved structure detection; also returns the word count."""
     all_blocks = []
     header_footer_candidates = defaultdict(list)
+    word_count = 0
     
-    # First pass: extract all text blocks with better structure detection
-    for page_num in range(doc.page_count):
-        page = doc[page_num]
-        
-        # Extract text blocks with improved parsing
-        page_blocks = _extract_page_blocks_improved(page, page_num + 1)
+    # First pass: extract all text blocks with better structure detection.
+    # Long documents are split into page ranges parsed in worker processes;
+    # fitz.Document is not picklable, so each worker reopens the file.
+    page_count = doc.page_count
+    if _can_parallelize(source, page_count):
+        step = -(-page_count // _PAGE_WORKERS)
+        starts = range(0, page_count, step)
+        results = list(_page_pool().map(
+            _parse_page_range_from_source,
+            [source] * len(starts),
+            starts,
+            [min(start + step, page_count) for start in starts],
+        ))
+    else:
+        results = [_parse_page_range(doc, 0, page_count)]
+    
+    # Merge in page order
+    for page_blocks, page_candidates, page_words in results:
         all_blocks.extend(page_blocks)
-        
-        # Identify potential headers/footers
-        _identify_header_footer_candidates(page, page_num + 1, header_footer_candidates)
+        word_count += page_words
+        for region, items in page_candidates.items():
+            header_footer_candidates[region].extend(items)
     
     # Second pass: identify actual headers/footers
     headers, footers = _identify_headers_footers(header_footer_candidates)
@@ -111,15 +172,45 @@ def _parse_pages(doc: fitz.Document, stats: TranslationStats) -> List[Section]:
     # Third pass: organize content into sections with better structure
     sections = _organize_into_sections_improved(all_blocks, headers, footers, stats)
     
-    return sections
+    return sections, word_count
+
+
+def _parse_page_range(doc: fitz.Document, start: int, stop: int) -> Tuple[List[Block], Dict[str, List], int]:
+    """Extract blocks, header/footer candidates and word count for pages ``start`` to ``stop - 1``."""
+    blocks = []
+    candidates = defaultdict(list)
+    word_count = 0
+    for page_num in range(start, stop):
+        page = doc[page_num]
+        
+        # One MuPDF text extraction per page, shared by every consumer below
+        text_blocks = page.get_text("blocks")
+        word_count += sum(len(block[4].split()) for block in text_blocks if block[6] == 0)
+        
+        # Extract text blocks with improved parsing
+        blocks.extend(_extract_page_blocks_improved(page, page_num + 1, text_blocks))
+        
+        # Identify potential headers/footers
+        _identify_header_footer_candidates(page, page_num + 1, candidates, text_blocks)
+    return blocks, dict(candidates), word_count
+
+
+def _parse_page_range_from_source(source: Union[str, Path], start: int, stop: int) -> Tuple[List[Block], Dict[str, List], int]:
+    """Process-pool entry point: open the PDF and parse one page range."""
+    doc = _open_pdf(source)
+    try:
+        return _parse_page_range(doc, start, stop)
+    finally:
+        doc.close()
 
 
-def _extract_page_blocks_improved(page: fitz.Page, page_num: int) -> List[Block]:
+def _extract_page_blocks_improved(page: fitz.Page, page_num: int, text_blocks: Optional[List] = None) -> List[Block]:
     """Extract blocks from a single page with simple, reliable text extraction."""
     blocks = []
     
     # Get all text in reading order - simple and reliable
-    text_blocks = page.get_text("blocks")
+    if text_blocks is None:
+        text_blocks = page.get_text("blocks")
     
     for block in text_blocks:
         if len(block) >= 5:  # Valid text block
@@ -176,60 +267,50 @@ def _format_text_simple(text: str, page_num: int) -> List[Block]:
     return blocks
 
 
+_LEVEL_ONE_DIGIT_PREFIXES = _DIGIT_DOT_PREFIXES[:5]
+_IMPROVED_HEADING_PREFIXES = (
+    ('Chapter', 'Section', 'Part', 'Appendix', 'CHAPTER')
+    + _DIGIT_DOT_PREFIXES
+    + _ROMAN_DOT_PREFIXES
+    + _LETTER_DOT_PREFIXES
+    + _LETTER_PAREN_PREFIXES
+    + _PAREN_DIGIT_PREFIXES
+)
+
+
+def _match_heading_prefix(text: str) -> Optional[re.Match]:
+    return _HEADING_PREFIX_RE.match(text) if text[:1] in _HEADING_FIRST_CHARS else None
+
+
 def _is_simple_heading(text: str) -> bool:
     """Simple heading detection based on common patterns."""
-    # Check for obvious heading patterns
-    heading_patterns = [
-        text.startswith(('Chapter', 'Section', 'Part', 'Appendix', 'CHAPTER', 'SECTION')),
-        text.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')),
-        text.startswith(('I.', 'II.', 'III.', 'IV.', 'V.', 'VI.', 'VII.', 'VIII.', 'IX.', 'X.')),
-        text.startswith(('A.', 'B.', 'C.', 'D.', 'E.', 'F.', 'G.', 'H.', 'I.', 'J.')),
-        text.startswith(('a)', 'b)', 'c)', 'd)', 'e)', 'f)', 'g)', 'h)', 'i)', 'j)')),
-        text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)', '(6)', '(7)', '(8)', '(9)')),
+    return (
+        # Check for obvious heading patterns
+        _match_heading_prefix(text) is not None
         # Short lines that could be headings
-        len(text) < 80 and not text.endswith('.') and not text.endswith(','),
+        or (len(text) < 80 and not text.endswith(('.', ',')))
         # All caps short lines
-        text.isupper() and len(text) < 100,
-    ]
-    
-    return any(heading_patterns)
+        or (text.isupper() and len(text) < 100)
+    )
 
 
 def _get_simple_heading_level(text: str) -> int:
     """Simple heading level detection."""
-    if text.startswith(('Chapter', 'CHAPTER', 'Section', 'SECTION')):
+    match = _match_heading_prefix(text)
+    if match is not None and match.lastindex:
+        return _HEADING_GROUP_LEVELS[match.lastindex]
+    # Default based on length
+    if len(text) < 30:
         return 1
-    elif text.startswith(('1.', '2.', '3.', '4.', '5.')):
-        return 1
-    elif text.startswith(('I.', 'II.', 'III.', 'IV.', 'V.')):
+    elif len(text) < 50:
         return 2
-    elif text.startswith(('A.', 'B.', 'C.', 'D.', 'E.')):
-        return 3
-    elif text.startswith(('a)', 'b)', 'c)', 'd)', 'e)')):
-        return 4
-    elif text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)')):
-        return 4
     else:
-        # Default based on length
-        if len(text) < 30:
-            return 1
-        elif len(text) < 50:
-            return 2
-        else:
-            return 3
+        return 3
 
 
 def _is_simple_list_item(text: str) -> bool:
     """Simple list item detection."""
-    list_patterns = [
-        text.startswith(('•', '-', '*', '◦', '▪', '▫')),
-        text.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')),
-        text.startswith(('a)', 'b)', 'c)', 'd)', 'e)', 'f)', 'g)', 'h)', 'i)', 'j)')),
-        text.startswith(('(a)', '(b)', '(c)', '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)')),
-        text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)', '(6)', '(7)', '(8)', '(9)')),
-    ]
-    
-    return any(list_patterns)
+    return text[:1] in _LIST_FIRST_CHARS and _LIST_PREFIX_RE.match(text) is not None
 
 
 def _get_simple_list_level(text: str) -> int:
@@ -245,7 +326,7 @@ def _get_simple_list_level(text: str) -> int:
 def _is_simple_ordered_list(text: str) -> bool:
     """Simple ordered list detection."""
     return (text[0].isdigit() and '.' in text[:5]) or \
-           text.startswith(('a)', 'b)', 'c)', 'i)', 'ii)', 'iii)'))
+           text.startswith(_ORDERED_LIST_PREFIXES)
 
 
 def _extract_page_blocks(page: fitz.Page, page_num: int) -> List[Block]:
@@ -295,17 +376,7 @@ def _classify_block_improved(text: str, block: dict, page: fitz.Page, x0: float,
 def _is_heading_improved(text: str, font_size: float, block_width: float, text_length: int) -> bool:
     """Improved heading detection."""
     # Check for common heading patterns
-    heading_patterns = [
-        text.startswith(('Chapter', 'Section', 'Part', 'Appendix', 'Chapter', 'CHAPTER')),
-        text.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')),
-        text.startswith(('I.', 'II.', 'III.', 'IV.', 'V.', 'VI.', 'VII.', 'VIII.', 'IX.', 'X.')),
-        text.startswith(('A.', 'B.', 'C.', 'D.', 'E.', 'F.', 'G.', 'H.', 'I.', 'J.')),
-        text.startswith(('a)', 'b)', 'c)', 'd)', 'e)', 'f)', 'g)', 'h)', 'i)', 'j)')),
-        text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)', '(6)', '(7)', '(8)', '(9)')),
-    ]
-    
-    # Check patterns
-    if any(heading_patterns):
+    if text.startswith(_IMPROVED_HEADING_PREFIXES):
         return True
     
     # Check font size (larger than normal text)
@@ -314,11 +385,11 @@ def _is_heading_improved(text: str, font_size: float, block_width: float, text_l
     
     # Check text characteristics
     if (text.isupper() and text_length < 100) or \
-       (text_length < 50 and not text.endswith('.') and not text.endswith(',')):
+       (text_length < 50 and not text.endswith(('.', ','))):
         return True
     
     # Check if it's a short line that could be a heading
-    if text_length < 80 and not text.endswith('.') and not text.endswith(','):
+    if text_length < 80 and not text.endswith(('.', ',')):
         return True
     
     return False
@@ -328,18 +399,18 @@ def _get_heading_level_improved(text: str, font_size: float, block_width: float)
     """Determine heading level with improved logic."""
     # Level 1: Very large font or chapter/section indicators
     if (font_size > 18) or \
-       text.startswith(('Chapter', 'CHAPTER', 'Section', 'SECTION')) or \
-       text.startswith(('1.', '2.', '3.', '4.', '5.')):
+       text.startswith(_CHAPTER_SECTION_PREFIXES) or \
+       text.startswith(_LEVEL_ONE_DIGIT_PREFIXES):
         return 1
     
     # Level 2: Large font or roman numerals
     if (font_size > 16) or \
-       text.startswith(('I.', 'II.', 'III.', 'IV.', 'V.', 'VI.', 'VII.', 'VIII.', 'IX.', 'X.')):
+       text.startswith(_ROMAN_DOT_PREFIXES):
         return 2
     
     # Level 3: Medium font or letter indicators
     if (font_size > 14) or \
-       text.startswith(('A.', 'B.', 'C.', 'D.', 'E.', 'F.', 'G.', 'H.', 'I.', 'J.')):
+       text.startswith(_LETTER_DOT_PREFIXES):
         return 3
     
     # Level 4: Small headings
@@ -353,15 +424,7 @@ def _get_heading_level_improved(text: str, font_size: float, block_width: float)
 def _is_list_item_improved(text: str) -> bool:
     """Improved list item detection."""
     # Check for various list patterns
-    list_patterns = [
-        text.startswith(('•', '-', '*', '◦', '▪', '▫')),
-        text.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')),
-        text.startswith(('a)', 'b)', 'c)', 'd)', 'e)', 'f)', 'g)', 'h)', 'i)', 'j)')),
-        text.startswith(('(a)', '(b)', '(c)', '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)')),
-        text.startswith(('(1)', '(2)', '(3)', '(4)', '(5)', '(6)', '(7)', '(8)', '(9)')),
-    ]
-    
-    return any(list_patterns)
+    return _is_simple_list_item(text)
 
 
 def _get_list_level_improved(text: str) -> int:
@@ -378,7 +441,7 @@ def _get_list_level_improved(text: str) -> int:
 def _is_ordered_list_improved(text: str) -> bool:
     """Check if list item is ordered."""
     return (text[0].isdigit() and '.' in text[:5]) or \
-           text.startswith(('a)', 'b)', 'c)', 'i)', 'ii)', 'iii)'))
+           text.startswith(_ORDERED_LIST_PREFIXES)
 
 
 def _is_table_improved(block: dict, text: str) -> bool:
@@ -430,7 +493,7 @@ def _is_list_item(text: str) -> bool:
     # Check for common list patterns
     return (text_clean.startswith(('•', '-', '*', '◦', '▪')) or
             text_clean[0].isdigit() and '.' in text_clean[:5] or
-            text_clean.startswith(('a)', 'b)', 'c)', 'i)', 'ii)', 'iii)')))
+            text_clean.startswith(_ORDERED_LIST_PREFIXES))
 
 
 def _get_list_level(text: str) -> int:
@@ -450,13 +513,15 @@ def _is_ordered_list(text: str) -> bool:
     """Check if list item is ordered."""
     text_clean = text.strip()
     return (text_clean[0].isdigit() and '.' in text_clean[:5]) or \
-           text_clean.startswith(('a)', 'b)', 'c)', 'i)', 'ii)', 'iii)'))
+           text_clean.startswith(_ORDERED_LIST_PREFIXES)
 
 
-def _identify_header_footer_candidates(page: fitz.Page, page_num: int, candidates: Dict[str, List]):
+def _identify_header_footer_candidates(page: fitz.Page, page_num: int, candidates: Dict[str, List],
+                                       blocks: Optional[List] = None):
     """Identify potential header/footer text."""
     # Get text blocks
-    blocks = page.get_text("blocks")
+    if blocks is None:
+        blocks = page.get_text("blocks")
     page_height = page.rect.height
     
     for block in blocks:
@@ -477,74 +542,55 @@ def _identify_header_footer_candidates(page: fitz.Page, page_num: int, candidate
 
 def _identify_headers_footers(candidates: Dict[str, List]) -> Tuple[Dict[int, str], Dict[int, str]]:
     """Identify actual headers and footers by finding repeated content."""
-    headers = {}
-    footers = {}
-    
-    # Find repeated header content
-    header_texts = [text for text, _ in candidates['header']]
-    header_counter = Counter(header_texts)
-    
-    for text, count in header_counter.items():
-        if count > 1:  # Appears on multiple pages
-            # Find which pages have this header
-            for text_candidate, page_num in candidates['header']:
-                if text_candidate == text:
-                    headers[page_num] = text
-    
-    # Find repeated footer content
-    footer_texts = [text for text, _ in candidates['footer']]
-    footer_counter = Counter(footer_texts)
-    
-    for text, count in footer_counter.items():
-        if count > 1:  # Appears on multiple pages
-            # Find which pages have this footer
-            for text_candidate, page_num in candidates['footer']:
-                if text_candidate == text:
-                    footers[page_num] = text
-    
-    return headers, footers
+    return _repeated_by_page(candidates['header']), _repeated_by_page(candidates['footer'])
+
+
+def _repeated_by_page(candidates: List[Tuple[str, int]]) -> Dict[int, str]:
+    """Map page number to text for every text that appears on multiple pages."""
+    pages_by_text = defaultdict(list)
+    for text, page_num in candidates:
+        pages_by_text[text].append(page_num)
+    return {
+        page_num: text
+        for text, page_nums in pages_by_text.items()
+        if len(page_nums) > 1  # Appears on multiple pages
+        for page_num in page_nums
+    }
 
 
 def _organize_into_sections_improved(blocks: List[Block], headers: Dict[int, str], 
                                    footers: Dict[int, str], stats: TranslationStats) -> List[Section]:
     """Organize blocks into sections with improved structure."""
     # Group blocks by logical sections based on headings
-    sections = []
-    current_section_blocks = []
+    sections = list(_iter_sections_improved(blocks)) or [Section(index=0, blocks=[])]
+    
+    # Update stats from one pass over the blocks
+    block_types = Counter(type(b) for b in blocks)
+    stats.paragraphs = block_types[Paragraph]
+    stats.tables = block_types[Table]
+    stats.figures = block_types[Figure]
+    stats.sections = len(sections)
+    
+    return sections
+
+
+def _iter_sections_improved(blocks: Iterable[Block]) -> Iterator[Section]:
+    """Yield sections in a single pass, starting a new one at each major heading."""
+    current_section_blocks: List[Block] = []
     section_index = 0
     
     for block in blocks:
         # If we encounter a heading, start a new section
-        if isinstance(block, Heading) and block.level <= 2:
-            # Save previous section if it has content
-            if current_section_blocks:
-                sections.append(Section(
-                    index=section_index,
-                    blocks=current_section_blocks
-                ))
-                section_index += 1
-                current_section_blocks = []
+        if type(block) is Heading and block.level <= 2 and current_section_blocks:
+            yield Section(index=section_index, blocks=current_section_blocks)
+            section_index += 1
+            current_section_blocks = []
         
         current_section_blocks.append(block)
     
     # Add the last section
     if current_section_blocks:
-        sections.append(Section(
-            index=section_index,
-            blocks=current_section_blocks
-        ))
-    
-    # If no sections were created, create one with all blocks
-    if not sections:
-        sections = [Section(index=0, blocks=blocks)]
-    
-    # Update stats
-    stats.paragraphs = len([b for b in blocks if isinstance(b, Paragraph)])
-    stats.tables = len([b for b in blocks if isinstance(b, Table)])
-    stats.figures = len([b for b in blocks if isinstance(b, Figure)])
-    stats.sections = len(sections)
-    
-    return sections
+        yield Section(index=section_index, blocks=current_section_blocks)
 
 
 def _organize_into_sections(blocks: List[Block], headers: Dict[int, str], 
@@ -589,28 +635,3 @@ def _extract_tables(page: fitz.Page, page_num: int) -> List[Table]:
             tables.append(Table(rows=table_rows))
     
     return tables
-
-
-def _detect_language(doc: IRDocument) -> str:
-    """Detect document language (simple heuristic)."""
-    # Extract all text
-    all_text = []
-    for section in doc.sections:
-        for block in section.blocks:
-            if isinstance(block, (Paragraph, Heading, ListItem)):
-                for span in getattr(block, 'spans', []):
-                    all_text.append(span.text)
-    
-    text_sample = ' '.join(all_text)[:1000]  # First 1000 chars
-    
-    # Simple heuristics
-    if any(char in text_sample for char in 'ابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی'):
-        return 'fa'  # Persian
-    elif any(char in text_sample for char in 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'):
-        return 'ru'  # Russian
-    elif any(char in text_sample for char in 'àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ'):
-        return 'fr'  # French
-    elif any(char in text_sample for char in 'äöüß'):
-        return 'de'  # German
-    else:
-        return 'en'  # Default to English
@@ -1,11 +1,48 @@
+import asyncio
+from functools import lru_cache
+from typing import List
+
 import httpx
 
+try:
+    import h2  # noqa: F401  - enables httpx's HTTP/2 support
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - optional extra
+    _HTTP2 = False
+
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123 Safari/537.36"
 }
 
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+
+@lru_cache(maxsize=1)
+def _client() -> httpx.Client:
+    # Shared across calls (and threads) so TLS sessions and keep-alive connections are reused.
+    return httpx.Client(follow_redirects=True, headers=DEFAULT_HEADERS, http2=_HTTP2, limits=_LIMITS)
+
+
 def fetch_url(url: str, timeout: float = 20.0) -> str:
-    with httpx.Client(follow_redirects=True, headers=DEFAULT_HEADERS, timeout=timeout) as c:
-        r = c.get(url)
-        r.raise_for_status()
-        return r.text
+    r = _client().get(url, timeout=timeout)
+    r.raise_for_status()
+    return r.text
+
+
+def async_client(timeout: float = 20.0) -> httpx.AsyncClient:
+    """Pooled client for concurrent fetches; open it per batch (it is bound to the running event loop)."""
+    return httpx.AsyncClient(
+        follow_redirects=True, headers=DEFAULT_HEADERS, http2=_HTTP2, limits=_LIMITS, timeout=timeout
+    )
+
+
+async def fetch_url_async(client: httpx.AsyncClient, url: str) -> str:
+    r = await client.get(url)
+    r.raise_for_status()
+    return r.text
+
+
+async def fetch_urls(urls: List[str], timeout: float = 20.0) -> List[str]:
+    """Fetch several URLs concurrently over one connection pool; results keep the input order."""
+    async with async_client(timeout) as c:
+        return list(await asyncio.gather(*(fetch_url_async(c, url) for url in urls)))
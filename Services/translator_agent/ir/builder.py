@@ -1,71 +1,107 @@
-from bs4 import BeautifulSoup
-import uuid
+from lxml import etree
+import itertools
+import os
 from .schema import Block, InlineSpan
 
+_HEADING_TAGS = frozenset(f"h{i}" for i in range(1, 7))
+# Text of a <pre>, leaving out script/style/template/ruby-annotation content like BeautifulSoup's get_text()
+_PRE_TEXT = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]"
+)
+
+
+# Block ids only need to be unique, not unpredictable: a per-process random tag plus a
+# counter avoids a urandom read per block.
+_ID_PREFIX = os.urandom(4).hex()
+_ID_COUNTER = itertools.count()
+
+
+def _reseed_ids() -> None:
+    # Forked workers (parse pools) must not continue the parent's id sequence
+    global _ID_PREFIX
+    _ID_PREFIX = os.urandom(4).hex()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_ids)
+
+
 def _new_id() -> str:
-    return uuid.uuid4().hex[:12]
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):x}"
+
+def parse_html(html: str):
+    """Parse an HTML string with lxml; returns the root element or None."""
+    # Parse from UTF-8 bytes: lxml refuses str input that carries an XML encoding declaration.
+    # Nothing looks elements up by id, so skip building libxml2's id hash table.
+    return etree.HTML(html.encode("utf-8"), etree.HTMLParser(encoding="utf-8", collect_ids=False))
 
 def html_to_ir(html: str):
-    soup = BeautifulSoup(html, "lxml")
-    body = soup.body or soup
+    root = parse_html(html)
     blocks: list[Block] = []
-    for el in body.find_all(recursive=False):
-        blocks.extend(_node_to_blocks(el))
+    if root is not None:
+        body = root.find("body")
+        for el in ([root] if body is None else body.iterchildren(etree.Element)):
+            blocks.extend(_node_to_blocks(el))
     return {"blocks": blocks, "attrs": {"lang": "auto", "dir": "auto"}}
 
-def _node_to_blocks(el):
-    name = el.name if hasattr(el, "name") else None
-    if name is None:
-        return []
-    if name in [f"h{i}" for i in range(1,7)]:
+def _node_to_blocks(el) -> list[Block]:
+    # Blocks are plain dict literals typed as Block; calling the TypedDict adds a kwargs round-trip
+    name = el.tag
+    if name in _HEADING_TAGS:
         level = int(name[1])
         spans = _collect_spans(el)
-        return [Block(id=_new_id(), type="heading", level=level, spans=spans, children=[], attrs={})]
-    if name in ["p"]:
+        return [{"id": _new_id(), "type": "heading", "level": level, "spans": spans, "children": [], "attrs": {}}]
+    if name == "p":
         spans = _collect_spans(el)
-        return [Block(id=_new_id(), type="paragraph", level=0, spans=spans, children=[], attrs={})]
-    if name in ["ul", "ol"]:
+        return [{"id": _new_id(), "type": "paragraph", "level": 0, "spans": spans, "children": [], "attrs": {}}]
+    if name in ("ul", "ol"):
         items = []
-        for li in el.find_all("li", recursive=False):
-            items.append(Block(id=_new_id(), type="list_item", level=0, spans=_collect_spans(li), children=[], attrs={}))
-        return [Block(id=_new_id(), type="list", level=0, spans=[], children=items, attrs={"ordered": name=="ol"})]
+        for li in el.iterchildren("li"):
+            items.append({"id": _new_id(), "type": "list_item", "level": 0, "spans": _collect_spans(li), "children": [], "attrs": {}})
+        return [{"id": _new_id(), "type": "list", "level": 0, "spans": [], "children": items, "attrs": {"ordered": name=="ol"}}]
     if name == "blockquote":
         spans = _collect_spans(el)
-        return [Block(id=_new_id(), type="blockquote", level=0, spans=spans, children=[], attrs={})]
+        return [{"id": _new_id(), "type": "blockquote", "level": 0, "spans": spans, "children": [], "attrs": {}}]
     if name == "pre":
-        code = el.get_text()
-        return [Block(id=_new_id(), type="codeblock", level=0, spans=[{"text": code, "code": True}], children=[], attrs={})]
+        code = "".join(_PRE_TEXT(el))
+        return [{"id": _new_id(), "type": "codeblock", "level": 0, "spans": [{"text": code, "code": True}], "children": [], "attrs": {}}]
     # tables and figures could be handled later
     # default: dive into children
     out = []
-    for child in el.find_all(recursive=False):
+    for child in el.iterchildren(etree.Element):
         out.extend(_node_to_blocks(child))
     return out
 
 def _collect_spans(el):
     spans: list[InlineSpan] = []
+    def emit(text, bold, italic, code, href):
+        if text and text.strip():
+            spans.append({"text": text, "bold": bold, "italic": italic, "code": code, **({"href": href} if href else {})})
     def walk(node, bold=False, italic=False, code=False, href=None):
-        if getattr(node, "name", None) is None:
-            text = str(node)
-            if text.strip():
-                spans.append({"text": text, "bold": bold, "italic": italic, "code": code, **({"href": href} if href else {})})
-            return
-        name = node.name.lower()
-        if name in ["strong","b"]:
+        name = node.tag
+        if name in ("strong", "b"):
             bold = True
-        if name in ["em","i"]:
+        if name in ("em", "i"):
             italic = True
         if name == "code":
             code = True
         if name == "a":
             href = node.get("href")
-        for c in node.children:
-            walk(c, bold, italic, code, href)
+        emit(node.text, bold, italic, code, href)
+        for c in node:
+            if isinstance(c.tag, str):
+                walk(c, bold, italic, code, href)
+            else:
+                # comments / processing instructions carry their content as text
+                emit(c.text, bold, italic, code, href)
+            # text following a child belongs to this node's formatting
+            emit(c.tail, bold, italic, code, href)
     walk(el)
     return spans
 
 def text_blocks_to_ir(paragraphs: list[str]):
-    blocks = []
+    blocks: list[Block] = []
     for p in paragraphs:
-        blocks.append(Block(id=_new_id(), type="paragraph", level=0, spans=[{"text": p}], children=[], attrs={}))
+        blocks.append({"id": _new_id(), "type": "paragraph", "level": 0, "spans": [{"text": p}], "children": [], "attrs": {}})
     return {"blocks": blocks, "attrs": {"lang": "auto", "dir": "auto"}}
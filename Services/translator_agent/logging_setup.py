@@ -1,15 +1,25 @@
-from rich.console import Console
-from rich.traceback import install
-from rich.logging import RichHandler
 import logging
-
-console = Console()
-install(show_locals=False)
+import os
 
 def setup_logging(level: int = logging.INFO):
+    # Records never show pid/thread names with this format, so skip collecting them
+    logging.logProcesses = False
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+
+    # Rich formatting (markup, pretty tracebacks) is opt-in; plain output keeps batch runs cheap
+    if os.getenv("RICH_LOGS") == "1":
+        from rich.logging import RichHandler
+        from rich.traceback import install
+
+        install(show_locals=False)
+        handler: logging.Handler = RichHandler(rich_tracebacks=True)
+    else:
+        handler = logging.StreamHandler()
+
     logging.basicConfig(
         level=level,
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(rich_tracebacks=True)]
+        handlers=[handler]
     )
@@ -1,9 +1,20 @@
 import time
+import hashlib
+import platform
+import select
+import weakref
 import psycopg2
-import subprocess
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
 from sentence_transformers import SentenceTransformer
-from datetime import datetime
+
+from config import settings
+from pipeline import pipeline_url
 
 FRESHRSS_DB = {
     "dbname": "freshrss",
@@ -13,48 +24,84 @@ FRESHRSS_DB = {
     "port": 5432,
 }
 
-MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+# int8-quantized ONNX export shipped with the model repo, run by ONNX Runtime;
+# pooling and normalization stay in sentence-transformers
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_ONNX_FILE = "onnx/model_quint8_avx2.onnx"
+
+def _has_avx2():
+    """True on x86-64 Linux hosts whose CPU advertises AVX2"""
+    if platform.machine().lower() not in ("x86_64", "amd64"):
+        return False
+    try:
+        return "avx2" in Path("/proc/cpuinfo").read_text().split()
+    except OSError:
+        return False
+
+def _load_model():
+    """The ONNX export where ONNX Runtime and AVX2 are available, else the torch model; returns (model, variant)"""
+    if _has_avx2():
+        try:
+            model = SentenceTransformer(
+                EMBEDDING_MODEL, backend="onnx", model_kwargs={"file_name": EMBEDDING_ONNX_FILE}
+            )
+            return model, EMBEDDING_ONNX_FILE
+        except (ImportError, OSError) as e:
+            print(f"⚠️  ONNX backend unavailable, using torch: {e}")
+    return SentenceTransformer(EMBEDDING_MODEL), "torch"
+
+MODEL, EMBEDDING_VARIANT = _load_model()
+
+@lru_cache(maxsize=1)
+def _pool():
+    # Created on first use so importing this module doesn't need the database
+    return ThreadedConnectionPool(1, 8, **FRESHRSS_DB)
+
+@contextmanager
+def _connection():
+    """Borrow a pooled connection; it is rolled back if left mid-transaction"""
+    conn = _pool().getconn()
+    try:
+        yield conn
+    finally:
+        _pool().putconn(conn)
+
+# Pooled connections that already hold the get_unread prepared statement
+_PREPARED = weakref.WeakSet()
 
 def get_new_freshrss_entries():
     """Fetch unread/new articles from FreshRSS DB"""
-    conn = psycopg2.connect(**FRESHRSS_DB)
-    cur = conn.cursor()
+    with _connection() as conn:
+        cur = conn.cursor()
 
-    # Fetch last 20 unread entries
-    cur.execute(
-        """
-        SELECT id, link, title, date
-        FROM admin_entry
-        WHERE is_read = 0
-        ORDER BY date DESC
-        LIMIT 20
-        """
-    )
-    rows = cur.fetchall()
-
-    results = []
-    for r in rows:
-        results.append(
-            {
-                "id": r[0],
-                "url": r[1],
-                "title": r[2],
-                "published_at": datetime.fromtimestamp(r[3]) if r[3] else None,
-            }
-        )
+        # Prepared once per pooled connection; each poll only sends EXECUTE
+        if conn not in _PREPARED:
+            cur.execute(
+                """
+                PREPARE get_unread(int) AS
+                SELECT id, link, title, date
+                FROM admin_entry
+                WHERE is_read = 0
+                ORDER BY date DESC
+                LIMIT $1
+                """
+            )
+            _PREPARED.add(conn)
+
+        # Fetch last 20 unread entries
+        cur.execute("EXECUTE get_unread(20)")
+        rows = cur.fetchall()
+        cur.close()
+
+    # published_at stays a Unix epoch; the INSERT converts it with to_timestamp()
+    results = [
+        {"id": r[0], "url": r[1], "title": r[2], "published_at": r[3] or None}
+        for r in rows
+    ]
 
-    cur.close()
-    conn.close()
     return results
 
-def mark_entries_as_read(entry_ids):
-    """Mark entries as read in the database"""
-    if not entry_ids:
-        return
-    
-    conn = psycopg2.connect(**FRESHRSS_DB)
-    cur = conn.cursor()
-    
+def _mark_read(cur, entry_ids):
     cur.execute(
         """
         UPDATE admin_entry
@@ -63,53 +110,74 @@ def mark_entries_as_read(entry_ids):
         """,
         (entry_ids,),
     )
+
+def mark_entries_as_read(entry_ids):
+    """Mark entries as read in the database"""
+    if not entry_ids:
+        return
     
-    conn.commit()
-    cur.close()
-    conn.close()
+    with _connection() as conn:
+        cur = conn.cursor()
+        _mark_read(cur, entry_ids)
+        conn.commit()
+        cur.close()
     print(f"✅ Marked {len(entry_ids)} entries as read")
 
 def run_translator_agent(url: str):
-    """Run your translator_agent script to fetch content and check result"""
+    """Run the translator pipeline in-process and return its manifest as JSON"""
     try:
-        cmd = [
-            "python",
-            "-m",
-            "app",
-            "url",
-            url,
-            "--out",
-            "docx",
-            "--dest",
-            "verbose",
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        # Check if the command was successful
-        if result.returncode == 0:
-            return result.stdout.strip(), True
-        else:
-            print(f"Translator agent failed for {url}: Command returned non-zero exit status {result.returncode}")
-            print(f"Stderr: {result.stderr}")
-            return None, False
-            
-    except subprocess.CalledProcessError as e:
-        print(f"Translator agent failed for {url}: {e}")
-        print(f"Stderr: {e.stderr}")
-        return None, False
+        dest_dir = Path("verbose").resolve()
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        manifest = pipeline_url(url, out_format="docx", model=settings.model, glossary=None, dest_dir=dest_dir)
+        # Same text the `python -m app url ... --out docx` CLI used to print
+        return json.dumps(manifest, ensure_ascii=False, indent=2), True
     except Exception as e:
-        print(f"Unexpected error in translator agent for {url}: {e}")
+        print(f"Translator agent failed for {url}: {e}")
         return None, False
 
+def embed_contents(cur, contents):
+    """Embed contents in one batched call, reusing embeddings cached by content hash"""
+    if not contents:
+        return []
+    # embedding_cache is created once by migrations/001_embedding_cache.sql
+    # The model variant is part of the key so vectors from another export are never reused
+    variant = f"{EMBEDDING_MODEL}/{EMBEDDING_VARIANT}\0".encode("utf-8")
+    keys = [hashlib.sha256(variant + c.encode("utf-8")).digest() for c in contents]
+    cur.execute(
+        "SELECT content_hash, embedding FROM embedding_cache WHERE content_hash = ANY(%s)",
+        ([psycopg2.Binary(k) for k in keys],),
+    )
+    cache = {bytes(h): embedding for h, embedding in cur.fetchall()}
+
+    # Duplicate articles in one batch are only encoded once
+    missing = {k: c for k, c in zip(keys, contents) if k not in cache}
+    if missing:
+        encoded = MODEL.encode(
+            list(missing.values()),
+            batch_size=32,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        ).tolist()
+        new = dict(zip(missing, encoded))
+        execute_values(
+            cur,
+            "INSERT INTO embedding_cache (content_hash, embedding) VALUES %s ON CONFLICT DO NOTHING",
+            [(psycopg2.Binary(k), embedding) for k, embedding in new.items()],
+        )
+        cache.update(new)
+    return [cache[k] for k in keys]
+
 def save_to_vector_db(entries):
     """Process entries and save to vector database, mark as read only on success"""
-    conn = psycopg2.connect(**FRESHRSS_DB)
-    cur = conn.cursor()
-    
     successful_entry_ids = []
+    translated = []
     
-    for e in entries:
-        content, success = run_translator_agent(e["url"])
+    # Entries are network/API-bound; translate up to settings.concurrency at a time
+    workers = max(1, min(settings.concurrency, len(entries)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run_translator_agent, [e["url"] for e in entries]))
+
+    for e, (content, success) in zip(entries, results):
         
         if not success:
             print(f"❌ Skipping entry {e['id']} due to translator failure")
@@ -119,37 +187,93 @@ def save_to_vector_db(entries):
             print(f"⚠️  No content returned for entry {e['id']}, but command succeeded")
             continue
 
+        translated.append((e, content))
+
+    # Borrow a connection only for the DB phase, not while translating
+    with _connection() as conn:
+        cur = conn.cursor()
         try:
-            embedding = MODEL.encode(content).tolist()
+            embeddings = embed_contents(cur, [content for _, content in translated])
+        except Exception as embed_error:
+            # Entries stay unread and are retried on the next poll
+            print(f"❌ Embedding error for {len(translated)} entries: {embed_error}")
+            conn.rollback()
+            embeddings = []
+
+        rows = [
+            (e["url"], e["id"], e["title"], content, e["published_at"], embedding)
+            for (e, content), embedding in zip(translated, embeddings)
+        ]
+        if rows:
+            try:
+                # One round-trip for the whole batch; a failed statement aborts the
+                # transaction anyway, so per-row inserts bought no partial success
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO news_articles (url, freshrss_id, title, content, published_at, embedding)
+                    VALUES %s
+                    ON CONFLICT (url) DO NOTHING
+                    """,
+                    rows,
+                    template="(%s, %s, %s, %s, to_timestamp(%s), %s)",
+                    page_size=100,
+                )
+
+                # Only mark as read if both translator and DB insertion succeeded;
+                # same connection and transaction as the inserts
+                entry_ids = [e["id"] for e, _ in translated]
+                _mark_read(cur, entry_ids)
+                conn.commit()
+                successful_entry_ids = entry_ids
+                for entry_id in successful_entry_ids:
+                    print(f"✅ Successfully processed entry {entry_id}")
+
+            except Exception as db_error:
+                # Nothing was written; the entries stay unread and are retried
+                print(f"❌ Database error inserting {len(rows)} entries: {db_error}")
+                conn.rollback()
+                successful_entry_ids = []
+
+        cur.close()
 
-            cur.execute(
-                """
-                INSERT INTO news_articles (url, freshrss_id, title, content, published_at, embedding)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (url) DO NOTHING
-                """,
-                (e["url"], e["id"], e["title"], content, e["published_at"], embedding),
-            )
-            
-            # Only mark as read if both translator and DB insertion succeeded
-            successful_entry_ids.append(e["id"])
-            print(f"✅ Successfully processed entry {e['id']}")
-            
-        except Exception as db_error:
-            print(f"❌ Database error for entry {e['id']}: {db_error}")
-            continue
-    
-    conn.commit()
-    cur.close()
-    conn.close()
-    
-    # Mark successful entries as read
     if successful_entry_ids:
-        mark_entries_as_read(successful_entry_ids)
+        print(f"✅ Marked {len(successful_entry_ids)} entries as read")
     else:
         print("❌ No entries were successfully processed")
 
+# Poll interval until a notification proves the trigger is installed
+POLL_INTERVAL = 30
+# Backstop poll interval when listening, in case a notification was missed
+LISTEN_TIMEOUT = 300
+
+def listen_for_new_entries():
+    """Dedicated connection LISTENing on new_entry (migrations/002_admin_entry_notify.sql); None if unavailable"""
+    conn = None
+    try:
+        conn = psycopg2.connect(**FRESHRSS_DB)
+        conn.autocommit = True
+        conn.cursor().execute("LISTEN new_entry")
+    except psycopg2.Error as e:
+        print(f"⚠️  LISTEN unavailable, falling back to polling: {e}")
+        if conn is not None:
+            conn.close()
+        return None
+    return conn
+
+def wait_for_new_entries(conn, timeout):
+    """Block until a new_entry notification arrives or timeout seconds pass; True if notified"""
+    if select.select([conn], [], [], timeout) == ([], [], []):
+        return False
+    conn.poll()
+    notified = bool(conn.notifies)
+    # One query picks up every entry announced so far
+    conn.notifies.clear()
+    return notified
+
 def main_loop():
+    listener = listen_for_new_entries()
+    heard = False
     while True:
         print("🔍 Checking FreshRSS for new entries...")
         entries = get_new_freshrss_entries()
@@ -159,7 +283,20 @@ def main_loop():
         else:
             print("No new entries.")
 
-        time.sleep(30)  # wait 5 minutes
+        if listener is None:
+            time.sleep(POLL_INTERVAL)
+            continue
+        try:
+            # Keep polling at the short interval until the channel has fired once
+            heard = wait_for_new_entries(listener, LISTEN_TIMEOUT if heard else POLL_INTERVAL) or heard
+        except (psycopg2.Error, OSError) as e:
+            # Server restarted or dropped the idle connection: LISTEN again
+            print(f"⚠️  Lost the LISTEN connection, reconnecting: {e}")
+            listener.close()
+            listener = listen_for_new_entries()
+            heard = False
+            if listener is None:
+                time.sleep(POLL_INTERVAL)
 
 if __name__ == "__main__":
     main_loop()
\ No newline at end of file
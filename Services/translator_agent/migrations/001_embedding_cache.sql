@@ -0,0 +1,7 @@
+-- Embeddings cached by SHA-256 of (model variant, content); see main.embed_contents.
+-- Apply once against the FreshRSS database:
+--   psql -h freshrss-db -U freshrss -d freshrss -f migrations/001_embedding_cache.sql
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    content_hash BYTEA PRIMARY KEY,
+    embedding REAL[] NOT NULL
+);
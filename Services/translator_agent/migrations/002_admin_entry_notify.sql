@@ -0,0 +1,14 @@
+-- Announce new FreshRSS entries on the new_entry channel; main.py LISTENs for it
+-- and polls every 30s until the first notification arrives.
+-- Apply once against the FreshRSS database:
+--   psql -h freshrss-db -U freshrss -d freshrss -f migrations/002_admin_entry_notify.sql
+CREATE OR REPLACE FUNCTION notify_new_entry() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('new_entry', NEW.id::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS admin_entry_notify ON admin_entry;
+CREATE TRIGGER admin_entry_notify AFTER INSERT ON admin_entry
+FOR EACH ROW EXECUTE PROCEDURE notify_new_entry();
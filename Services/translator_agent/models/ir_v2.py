@@ -12,6 +12,16 @@ from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.section import WD_SECTION_START
 import io
+import re
+
+_HEX_COLOR_RE = re.compile(r'[0-9a-fA-F]{6}')
+
+_ALIGN_MAP = {
+    'left': WD_ALIGN_PARAGRAPH.LEFT,
+    'right': WD_ALIGN_PARAGRAPH.RIGHT,
+    'center': WD_ALIGN_PARAGRAPH.CENTER,
+    'justify': WD_ALIGN_PARAGRAPH.JUSTIFY
+}
 
 
 class DocumentMeta(BaseModel):
@@ -180,66 +190,65 @@ class Document(BaseModel):
                 run.font.size = Pt(span.font_size)
             if span.font_family:
                 run.font.name = span.font_family
-            if span.color and len(span.color) == 6:
-                try:
-                    r = int(span.color[0:2], 16)
-                    g = int(span.color[2:4], 16)
-                    b = int(span.color[4:6], 16)
-                    run.font.color.rgb = RGBColor(r, g, b)
-                except ValueError:
-                    pass  # Invalid color, skip
+            if span.color and _HEX_COLOR_RE.fullmatch(span.color):  # Invalid color, skip
+                value = int(span.color, 16)
+                run.font.color.rgb = RGBColor(value >> 16, (value >> 8) & 0xFF, value & 0xFF)
             # Link handling skipped for simplicity
 
+    def _add_heading(self, block: Heading, container) -> None:
+        p = container.add_paragraph()
+        p.style = f'Heading {block.level}'
+        self._add_spans_to_paragraph(block.spans, p)
+
+    def _add_paragraph(self, block: Paragraph, container) -> None:
+        p = container.add_paragraph()
+        self._add_spans_to_paragraph(block.spans, p)
+        if block.alignment:
+            p.alignment = _ALIGN_MAP.get(block.alignment)
+        if block.line_spacing:
+            p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.MULTIPLE
+            p.paragraph_format.line_spacing = block.line_spacing
+
+    def _add_list_item(self, block: ListItem, container) -> None:
+        style = 'List Number' if block.ordered else 'List Bullet'
+        p = container.add_paragraph()
+        p.style = style
+        p.paragraph_format.left_indent = Inches(0.25 * (block.level + 1))
+        p.clear()  # Clear default text if any
+        self._add_spans_to_paragraph(block.spans, p)
+
+    def _add_table(self, block: Table, container) -> None:
+        # Compute max columns considering colspans
+        max_cols = max(sum(cell.colspan for cell in row.cells) for row in block.rows)
+        table = container.add_table(rows=len(block.rows), cols=max_cols)
+        for row_idx, row in enumerate(block.rows):
+            col_idx = 0
+            for cell in row.cells:
+                tc = table.cell(row_idx, col_idx)
+                if cell.colspan > 1 or cell.rowspan > 1:
+                    tc.merge(table.cell(row_idx + cell.rowspan - 1, col_idx + cell.colspan - 1))
+                self._add_blocks_to_container(cell.blocks, tc)
+                col_idx += cell.colspan
+
+    def _add_figure(self, block: Figure, container) -> None:
+        if block.image_data:
+            stream = io.BytesIO(block.image_data)
+            p = container.add_paragraph()
+            run = p.add_run()
+            run.add_picture(stream, width=Inches(block.width or 4), height=Inches(block.height or 3))
+        if block.caption:
+            self._add_blocks_to_container([block.caption], container)
+
+    def _add_textbox(self, block: Textbox, container) -> None:
+        # Render inline for simplicity
+        self._add_blocks_to_container(block.blocks, container)
+
     def _add_blocks_to_container(self, blocks: List[Block], container) -> None:
+        # Exact-type dispatch; isinstance() on pydantic models goes through the metaclass hook
         for block in blocks:
-            if isinstance(block, Heading):
-                p = container.add_paragraph()
-                p.style = f'Heading {block.level}'
-                self._add_spans_to_paragraph(block.spans, p)
-            elif isinstance(block, Paragraph):
-                p = container.add_paragraph()
-                self._add_spans_to_paragraph(block.spans, p)
-                if block.alignment:
-                    align_map = {
-                        'left': WD_ALIGN_PARAGRAPH.LEFT,
-                        'right': WD_ALIGN_PARAGRAPH.RIGHT,
-                        'center': WD_ALIGN_PARAGRAPH.CENTER,
-                        'justify': WD_ALIGN_PARAGRAPH.JUSTIFY
-                    }
-                    p.alignment = align_map.get(block.alignment)
-                if block.line_spacing:
-                    p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.MULTIPLE
-                    p.paragraph_format.line_spacing = block.line_spacing
-            elif isinstance(block, ListItem):
-                style = 'List Number' if block.ordered else 'List Bullet'
-                p = container.add_paragraph()
-                p.style = style
-                p.paragraph_format.left_indent = Inches(0.25 * (block.level + 1))
-                p.clear()  # Clear default text if any
-                self._add_spans_to_paragraph(block.spans, p)
-            elif isinstance(block, Table):
-                # Compute max columns considering colspans
-                max_cols = max(sum(cell.colspan for cell in row.cells) for row in block.rows)
-                table = container.add_table(rows=len(block.rows), cols=max_cols)
-                for row_idx, row in enumerate(block.rows):
-                    col_idx = 0
-                    for cell in row.cells:
-                        tc = table.cell(row_idx, col_idx)
-                        if cell.colspan > 1 or cell.rowspan > 1:
-                            tc.merge(table.cell(row_idx + cell.rowspan - 1, col_idx + cell.colspan - 1))
-                        self._add_blocks_to_container(cell.blocks, tc)
-                        col_idx += cell.colspan
-            elif isinstance(block, Figure):
-                if block.image_data:
-                    stream = io.BytesIO(block.image_data)
-                    p = container.add_paragraph()
-                    run = p.add_run()
-                    run.add_picture(stream, width=Inches(block.width or 4), height=Inches(block.height or 3))
-                if block.caption:
-                    self._add_blocks_to_container([block.caption], container)
-            elif isinstance(block, Textbox):
-                # Render inline for simplicity
-                self._add_blocks_to_container(block.blocks, container)
+            add = _BLOCK_WRITERS.get(type(block))
+            if add is not None:
+                add(self, block, container)
 
     def to_docx(self, filename: str) -> None:
         doc = DocxDocument()
@@ -281,6 +290,16 @@ class Document(BaseModel):
         doc.save(filename)
 
 
+_BLOCK_WRITERS = {
+    Heading: Document._add_heading,
+    Paragraph: Document._add_paragraph,
+    ListItem: Document._add_list_item,
+    Table: Document._add_table,
+    Figure: Document._add_figure,
+    Textbox: Document._add_textbox,
+}
+
+
 class GlossaryEntry(BaseModel):
     """Glossary entry for translation."""
     source: str
@@ -4,13 +4,16 @@ from blingfire import text_to_sentences
 
 def split_paragraph(p: str, model: str, budget: int, overhead: int = 200) -> List[str]:
     sentences = [s for s in text_to_sentences(p).split("\n") if s.strip()]
-    chunks, cur = [], ""
+    # Tokenize each sentence once and keep a running total instead of re-counting the
+    # growing chunk (O(n^2)); the joining space merges into the next token under BPE
+    chunks, cur, cur_tokens = [], "", 0
     for s in sentences:
-        candidate = (cur + " " + s).strip() if cur else s
-        if count_tokens(candidate, model) + overhead <= budget:
-            cur = candidate
+        tokens = count_tokens(s, model)
+        if cur and cur_tokens + tokens + overhead <= budget:
+            cur = cur + " " + s
+            cur_tokens += tokens
         else:
             if cur: chunks.append(cur)
-            cur = s
+            cur, cur_tokens = s, tokens
     if cur: chunks.append(cur)
     return chunks
@@ -1,12 +1,21 @@
+from functools import lru_cache
+
 from langdetect import detect
 
-def detect_lang_doc(ir: dict) -> str:
+def _sample(ir: dict) -> str:
     sample = []
     for b in ir.get("blocks", [])[:30]:
         for s in b.get("spans", []):
             sample.append(s.get("text",""))
-    text = "\n".join(sample)[:2000]
+    return "\n".join(sample)[:2000]
+
+@lru_cache(maxsize=1024)
+def _detect(text: str) -> str:
+    # langdetect is pure Python and slow; retried or repeated documents hit the cache
     try:
         return detect(text)
     except Exception:
         return "unknown"
+
+def detect_lang_doc(ir: dict) -> str:
+    return _detect(_sample(ir))
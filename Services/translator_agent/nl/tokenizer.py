@@ -1,8 +1,13 @@
+from functools import lru_cache
+
 import tiktoken
 
-def count_tokens(text: str, model: str) -> int:
+@lru_cache(maxsize=None)
+def _encoding(model: str):
     try:
-        enc = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except Exception:
-        enc = tiktoken.get_encoding("cl100k_base")
-    return len(enc.encode(text))
+        return tiktoken.get_encoding("cl100k_base")
+
+def count_tokens(text: str, model: str) -> int:
+    return len(_encoding(model).encode(text))
@@ -1,10 +1,11 @@
 # translator_agent/pipeline.py
 
 from pathlib import Path
-from typing import Optional, Dict, Any
-import json, time, uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
+import asyncio, json, os, time, uuid
 
-from ingestion.url_loader import fetch_url
+from ingestion.url_loader import async_client, fetch_url, fetch_url_async
 from ingestion.file_loader import read_file, sniff_type
 from extract.html_article import extract_main_article_html
 from extract.pdf_parser import pdf_to_html_like
@@ -28,6 +29,13 @@ def _new_id() -> str:
     return uuid.uuid4().hex[:12]
 
 
+def _new_job_dir(dest_dir: Path) -> Path:
+    # The random suffix keeps concurrent runs started in the same second apart.
+    job_dir = dest_dir / f"job_{int(time.time())}_{_new_id()[:6]}"
+    job_dir.mkdir(parents=True, exist_ok=True)
+    return job_dir
+
+
 def _prepend_notice(ir: dict, message: str) -> dict:
     """Prepend a small 'Translation section' notice and then keep original extracted content."""
     notice_blocks = [
@@ -88,8 +96,7 @@ def pipeline_url(url: str, *, out_format: str, model: str, glossary: Optional[Di
         return plain_text
 
     # File outputs: create a job dir and write the requested format
-    job_dir = dest_dir / ("job_" + str(int(time.time())))
-    job_dir.mkdir(parents=True, exist_ok=True)
+    job_dir = _new_job_dir(dest_dir)
 
     out_name = "output.fa"
     if out_fmt == "docx":
@@ -124,18 +131,19 @@ def pipeline_file(path: str, *, out_format: str, model: str, glossary: Optional[
     - When out_format in {"docx", "pdf", "html"}: write file and return a manifest dict.
     """
 
-    blob = read_file(path)
     kind = sniff_type(path)
+    # PDF/DOCX parsers open the path themselves (PyMuPDF maps the file, zipfile seeks
+    # into it), so only HTML is read into memory here.
     if kind == "html":
-        html = blob.decode("utf-8", errors="ignore")
+        html = read_file(path).decode("utf-8", errors="ignore")
         article_html = html
         ir = html_to_ir(article_html)
     elif kind == "pdf":
-        article_html = pdf_to_html_like(blob)
+        article_html = pdf_to_html_like(path)
         # pdf_to_html_like returns HTML; convert to IR
         ir = html_to_ir(article_html)
     elif kind == "docx":
-        article_html = docx_to_html(blob)
+        article_html = docx_to_html(path)
         ir = html_to_ir(article_html)
     else:
         raise ValueError(f"Unsupported file type: {kind}")
@@ -163,8 +171,7 @@ def pipeline_file(path: str, *, out_format: str, model: str, glossary: Optional[
         return plain_text
 
     # File outputs: create a job dir and write the requested format
-    job_dir = dest_dir / ("job_" + str(int(time.time())))
-    job_dir.mkdir(parents=True, exist_ok=True)
+    job_dir = _new_job_dir(dest_dir)
 
     out_name = Path(path).stem + ".fa"
     if out_fmt == "docx":
@@ -190,3 +197,74 @@ def pipeline_file(path: str, *, out_format: str, model: str, glossary: Optional[
     }
     _save_intermediate(job_dir, "manifest", manifest)
     return manifest
+
+
+def pipeline_files(paths: List[str], *, out_format: str, model: str, glossary: Optional[Dict[str, str]], dest_dir: Path) -> List[Any]:
+    """Run ``pipeline_file`` over several files, up to ``settings.concurrency`` at a time.
+
+    Results come back in input order. A file that fails yields
+    ``{"source": ..., "error": ...}`` instead of aborting the whole batch.
+    """
+
+    def _one(path: str) -> Any:
+        try:
+            return pipeline_file(path, out_format=out_format, model=model, glossary=glossary, dest_dir=dest_dir)
+        except Exception as exc:
+            return {"source": {"type": "file", "path": str(Path(path).resolve())}, "error": str(exc)}
+
+    workers = max(1, min(settings.concurrency, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_one, paths))
+
+
+# Fetched pages waiting for extraction; bounds memory when fetching outpaces parsing.
+_INGEST_QUEUE_SIZE = 8
+
+
+def _article_ir(html: str, url: str) -> dict:
+    return html_to_ir(extract_main_article_html(html, base_url=url))
+
+
+def ingest_urls(urls: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Fetch several URLs and build their article IR, overlapping network and parsing.
+
+    Pages are fetched concurrently on one connection pool and handed through a bounded
+    queue to ``workers`` processes (default: CPU count) running readability and the IR
+    builder. Results come back in input order as ``{"source": ..., "ir": ...}``, or
+    ``{"source": ..., "error": ...}`` for a URL that failed.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(urls) or 1))
+    return asyncio.run(_ingest_urls(urls, workers))
+
+
+async def _ingest_urls(urls: List[str], workers: int) -> List[Dict[str, Any]]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_INGEST_QUEUE_SIZE)
+    results: List[Dict[str, Any]] = [
+        {"source": {"type": "url", "url": url}} for url in urls
+    ]
+
+    async def _fetch(client, i: int, url: str) -> None:
+        try:
+            html = await fetch_url_async(client, url)
+        except Exception as exc:
+            results[i]["error"] = str(exc)
+            return
+        await queue.put((i, url, html))
+
+    async def _consume(pool: ProcessPoolExecutor) -> None:
+        while (item := await queue.get()) is not None:
+            i, url, html = item
+            try:
+                results[i]["ir"] = await loop.run_in_executor(pool, _article_ir, html, url)
+            except Exception as exc:
+                results[i]["error"] = str(exc)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        consumers = [asyncio.create_task(_consume(pool)) for _ in range(workers)]
+        async with async_client() as client:
+            await asyncio.gather(*(_fetch(client, i, url) for i, url in enumerate(urls)))
+        for _ in consumers:
+            await queue.put(None)
+        await asyncio.gather(*consumers)
+    return results
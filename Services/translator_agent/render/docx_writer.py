@@ -1,45 +1,134 @@
 # translator_agent/render/docx_writer.py
+import io
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from bs4 import BeautifulSoup
 from docx import Document
 from docx.oxml.shared import OxmlElement, qn
+from docx.enum.style import WD_STYLE_TYPE
 from docx.shared import Pt
+from lxml import etree
 import re
+import weakref
+
+from ir.builder import parse_html
 
 # Detect any RTL script char (Hebrew/Arabic/Persian ranges)
-_RTL_RE = re.compile(r"[\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]")
+_RTL_RE = re.compile(r"[\u0590-\u06FF\u0750-\u077F\u08A0-\u08FF]")
+
+_HEADING_TAGS = frozenset(f"h{i}" for i in range(1, 7))
+# Element text as BeautifulSoup's get_text() returned it: no script/style/template/ruby-annotation content
+_OPAQUE_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+_TEXT = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]"
+)
+
+def _text(el) -> str:
+    if el.tag in _OPAQUE_TAGS:
+        # ...but called on such an element itself, get_text() returned its content
+        return "".join(el.xpath("descendant-or-self::text()"))
+    return "".join(_TEXT(el))
+
+# Below this length the regex beats NumPy's fixed per-call cost (crossover is ~2.5k chars)
+_RTL_VECTOR_MIN = 4096
+_RTL_PREFIX = 256
 
 def _is_rtl(text: str) -> bool:
-    return bool(_RTL_RE.search(text or ""))
-
-def _apply_rtl(paragraph):
-    pPr = paragraph._element.get_or_add_pPr()
-    bidi = OxmlElement('w:bidi')
-    bidi.set(qn('w:val'), "1")
-    pPr.append(bidi)
-
-def _add_para(doc: Document, text: str, style: str | None = None, force_rtl: bool | None = None):
-    p = doc.add_paragraph()
-    if style:
+    # Pure-ASCII text (most source paragraphs) can't contain an RTL char; isascii() is O(1)
+    if not text or text.isascii():
+        return False
+    if len(text) < _RTL_VECTOR_MIN:
+        return bool(_RTL_RE.search(text))
+    # Long text: RTL paragraphs show it early, otherwise scan the rest vectorized
+    return bool(_RTL_RE.search(text, 0, _RTL_PREFIX)) or _has_rtl_codepoint(text[_RTL_PREFIX:])
+
+def _has_rtl_codepoint(text: str) -> bool:
+    import numpy as np
+
+    # Offsets from U+0590 in uint32 wrap around below it, so each range is one compare
+    cp = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32) - np.uint32(0x0590)
+    return bool(
+        ((cp < 0x170) | ((cp - np.uint32(0x01C0)) < 0x30) | ((cp - np.uint32(0x0310)) < 0x60)).any()
+    )
+
+_W_PPR = qn("w:pPr")
+_W_PSTYLE = qn("w:pStyle")
+_W_BIDI = qn("w:bidi")
+_W_R = qn("w:r")
+_W_RPR = qn("w:rPr")
+_W_B = qn("w:b")
+_W_T = qn("w:t")
+_W_TAB = qn("w:tab")
+_W_BR = qn("w:br")
+_W_VAL = qn("w:val")
+_XML_SPACE = qn("xml:space")
+_BIDI_ATTRS = {_W_VAL: "1"}
+# Run text splits into <w:t> pieces around tabs and line breaks, like python-docx's run.text
+_RUN_BREAK_RE = re.compile(r"([\t\r\n])")
+
+# python-docx resolves a style name by scanning the styles part (and scans it again for the
+# default style), so each name is resolved once per document
+_STYLE_IDS = weakref.WeakKeyDictionary()
+
+def _style_id(doc: Document, style: str) -> str | None:
+    ids = _STYLE_IDS.setdefault(doc.part, {})
+    if style not in ids:
         try:
-            p.style = style
+            ids[style] = doc.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
         except Exception:
-            pass  # style may not exist; ignore
+            ids[style] = None  # style may not exist; ignore
+    return ids[style]
 
-    p.add_run(text)
+def _add_para(doc: Document, text: str, style: str | None = None, force_rtl: bool | None = None, bold: bool = False):
+    # Build the <w:p> directly rather than through python-docx's Paragraph/Run proxies;
+    # the XML is what doc.add_paragraph() + add_run(text) would produce
+    p = OxmlElement("w:p")
+    style_id = _style_id(doc, style) if style else None
 
     # Decide direction: explicit override > heuristic
     rtl = force_rtl if force_rtl is not None else _is_rtl(text)
-    if rtl:
-        _apply_rtl(p)
+    if style_id or rtl:
+        pPr = etree.SubElement(p, _W_PPR)
+        if style_id:
+            etree.SubElement(pPr, _W_PSTYLE, {_W_VAL: style_id})
+        if rtl:
+            etree.SubElement(pPr, _W_BIDI, _BIDI_ATTRS)
     # else: leave as default LTR
 
+    r = etree.SubElement(p, _W_R)
+    if bold:
+        etree.SubElement(etree.SubElement(r, _W_RPR), _W_B)
+    for piece in _RUN_BREAK_RE.split(text):
+        if piece == "\t":
+            etree.SubElement(r, _W_TAB)
+        elif piece == "\r" or piece == "\n":
+            etree.SubElement(r, _W_BR)
+        elif piece:
+            t = etree.SubElement(r, _W_T)
+            t.text = piece
+            if len(piece.strip()) < len(piece):
+                t.set(_XML_SPACE, "preserve")
+
+    # Paragraphs go before the body's trailing sectPr, as add_paragraph() places them
+    body = doc.element.body
+    sectPr = body.sectPr
+    if sectPr is None:
+        body.append(p)
+    else:
+        sectPr.addprevious(p)
+
 def _resolve_image_source(src: str | None, assets_dir: Optional[Path]) -> Optional[Path]:
     if not src:
         return None
+    return _resolve_image_source_cached(src, assets_dir)
+
 
+# Documents often reference the same image several times; html_to_docx clears this per
+# call so files that appear or move between documents are still picked up
+@lru_cache(maxsize=4096)
+def _resolve_image_source_cached(src: str, assets_dir: Optional[Path]) -> Optional[Path]:
     candidate = Path(src)
     if candidate.is_absolute() and candidate.exists():
         return candidate
@@ -79,6 +168,68 @@ def _add_image(doc: Document, src: str | None, alt: str | None, assets_dir: Opti
         caption.italic = True
 
 
+# Top-level element writers: (doc, el, rtl_override, assets_dir, collect) -> None,
+# where collect() receives each paragraph's text for the plain-text result
+
+def _write_paragraph_text(doc, text, rtl_override, collect) -> None:
+    _add_para(doc, text, force_rtl=rtl_override)
+    collect(text)
+
+def _write_images(doc, images, assets_dir) -> None:
+    for img in images:
+        _add_image(doc, img.get("src"), img.get("alt"), assets_dir)
+
+def _write_heading(doc, el, rtl_override, assets_dir, collect) -> None:
+    text = _text(el)
+    _add_para(doc, text, style=None, force_rtl=rtl_override, bold=True)
+    collect(text)
+
+def _write_p(doc, el, rtl_override, assets_dir, collect) -> None:
+    text = _text(el)
+    images = list(el.iterdescendants("img"))
+    if images and not text.strip():
+        _write_images(doc, images, assets_dir)
+    elif text.strip():
+        _write_paragraph_text(doc, text, rtl_override, collect)
+
+def _write_list(doc, el, rtl_override, assets_dir, collect) -> None:
+    style = "List Number" if el.tag == "ol" else "List Bullet"
+    for li in el.iterchildren("li"):
+        text = _text(li)
+        li_images = list(li.iterdescendants("img"))
+        if li_images and not text.strip():
+            _write_images(doc, li_images, assets_dir)
+            continue
+        _add_para(doc, text, style=style, force_rtl=rtl_override)
+        collect(text)
+
+def _write_blockquote(doc, el, rtl_override, assets_dir, collect) -> None:
+    _write_paragraph_text(doc, _text(el), rtl_override, collect)
+
+def _write_pre(doc, el, rtl_override, assets_dir, collect) -> None:
+    text = _text(el)
+    _add_para(doc, text, force_rtl=False if rtl_override is None else rtl_override)
+    collect(text)
+
+def _write_img(doc, el, rtl_override, assets_dir, collect) -> None:
+    _add_image(doc, el.get("src"), el.get("alt"), assets_dir)
+
+def _write_other(doc, el, rtl_override, assets_dir, collect) -> None:
+    text = _text(el)
+    if text.strip():
+        _write_paragraph_text(doc, text, rtl_override, collect)
+
+_ELEMENT_WRITERS = {
+    **dict.fromkeys(_HEADING_TAGS, _write_heading),
+    "p": _write_p,
+    "ul": _write_list,
+    "ol": _write_list,
+    "blockquote": _write_blockquote,
+    "pre": _write_pre,
+    "img": _write_img,
+}
+
+
 def html_to_docx(
     html: str,
     out_path: str | Path | None = None,
@@ -91,7 +242,8 @@ def html_to_docx(
     Convert our simple HTML to a DOCX, applying RTL only to Farsi/Arabic/Hebrew paragraphs,
     and keeping English paragraphs LTR.
     """
-    soup = BeautifulSoup(html, "lxml")
+    _resolve_image_source_cached.cache_clear()
+    root = parse_html(html)
     doc = Document()
 
     # Set a readable default font; Word will still render English fine with this.
@@ -102,68 +254,21 @@ def html_to_docx(
         normal.font.name = "Calibri"
     normal.font.size = Pt(11)
 
-    body = soup.body or soup
-    all_texts = []
+    body = None if root is None else root.find("body")
+    if body is None:
+        elements = [] if root is None else [root]
+    else:
+        elements = body.iterchildren(etree.Element)
+    text_buf = io.StringIO()
 
-    def _handle_paragraph(text: str) -> None:
-        _add_para(doc, text, force_rtl=rtl_override)
-        all_texts.append(text)
+    def _collect(text: str) -> None:
+        text_buf.write(text)
+        text_buf.write("\n")
 
-    for el in body.find_all(recursive=False):
-        name = el.name
-        if not name:
-            continue
+    for el in elements:
+        _ELEMENT_WRITERS.get(el.tag, _write_other)(doc, el, rtl_override, assets_dir, _collect)
 
-        if name in [f"h{i}" for i in range(1, 7)]:
-            text = el.get_text()
-            _add_para(doc, text, style=None, force_rtl=rtl_override)
-            doc.paragraphs[-1].runs[0].bold = True
-            if rtl_override is None and _is_rtl(text):
-                _apply_rtl(doc.paragraphs[-1])
-            all_texts.append(text)
-
-        elif name == "p":
-            images = list(el.find_all("img"))
-            if images and not el.get_text(strip=True):
-                for img in images:
-                    _add_image(doc, img.get("src"), img.get("alt"), assets_dir)
-                continue
-
-            text = el.get_text()
-            if text.strip():
-                _handle_paragraph(text)
-
-        elif name in ["ul", "ol"]:
-            ordered = name == "ol"
-            for li in el.find_all("li", recursive=False):
-                li_images = list(li.find_all("img"))
-                if li_images and not li.get_text(strip=True):
-                    for img in li_images:
-                        _add_image(doc, img.get("src"), img.get("alt"), assets_dir)
-                    continue
-                text = li.get_text()
-                style = "List Number" if ordered else "List Bullet"
-                _add_para(doc, text, style=style, force_rtl=rtl_override)
-                all_texts.append(text)
-
-        elif name == "blockquote":
-            text = el.get_text()
-            _handle_paragraph(text)
-
-        elif name == "pre":
-            text = el.get_text()
-            _add_para(doc, text, force_rtl=False if rtl_override is None else rtl_override)
-            all_texts.append(text)
-
-        elif name == "img":
-            _add_image(doc, el.get("src"), el.get("alt"), assets_dir)
-
-        else:
-            text = el.get_text()
-            if text.strip():
-                _handle_paragraph(text)
-
-    plain_text = "\n".join(all_texts)
+    plain_text = text_buf.getvalue()[:-1]  # drop the last separator; "" when nothing was collected
 
     if out_path is not None and not text_only:
         doc.save(str(out_path))
@@ -95,7 +95,27 @@ def ir_to_html(ir: dict) -> str:
     return "".join(parts)
 
 
-_MD = MarkdownIt("commonmark", {"html": False, "linkify": True}).enable("table").enable("strikethrough")
+try:
+    # Rust port of markdown-it; same output for the rule set below, several times faster.
+    from markdown_it_pyrs import MarkdownIt as _RustMarkdownIt
+except ImportError:  # pragma: no cover - optional accelerator
+    _RustMarkdownIt = None
+
+# CommonMark minus raw HTML (html_block/html_inline), plus tables and strikethrough.
+_MD_RULES = [
+    "blockquote", "code", "fence", "heading", "hr", "lheading", "list", "paragraph", "reference",
+    "autolink", "backticks", "emphasis", "entity", "escape", "image", "link", "newline",
+    "table", "strikethrough",
+]
+
+if _RustMarkdownIt is not None:
+    _MD = _RustMarkdownIt("zero").enable_many(_MD_RULES)
+else:
+    _MD = MarkdownIt("commonmark", {"html": False, "linkify": True}).enable("table").enable("strikethrough")
+
+
+def _render_body(md_text: str) -> str:
+    return _MD.render(md_text)
 
 
 def md_to_html(
@@ -108,7 +128,7 @@ def md_to_html(
 ) -> str:
     """Render Markdown to HTML, optionally returning only the rendered body."""
     rtl = _is_rtl(md_text) if rtl is None else rtl
-    body = _MD.render(md_text or "")
+    body = _render_body(md_text or "")
     if image_prefix:
         body = _prefix_image_sources(body, image_prefix)
     if not wrap:
@@ -119,3 +139,10 @@ def md_to_html(
 def wrap_html_document(body: str, *, rtl: bool = False, lang: str = "en") -> str:
     """Wrap a raw HTML body fragment into a standalone HTML document."""
     return _wrap_html_document(body, rtl=rtl, lang=lang)
+
+
+def md_pair_to_html(original_md: str, translated_md: str | None) -> tuple[str, str | None]:
+    """Render the original and (optional) translated Markdown bodies with the shared parser."""
+    original_body = _render_body(original_md or "")
+    translated_body = _render_body(translated_md) if translated_md else None
+    return original_body, translated_body
@@ -2,7 +2,6 @@ import io
 import zipfile
 from fastapi.testclient import TestClient
 
-import docling.engine
 from translator_agent import api as api_module
 
 PNG_DATA_URI = (
@@ -23,7 +22,7 @@ def _stub_parse_to_markdown(_src_path, work_dir):
 
 
 def test_docling_pipeline_without_api(monkeypatch):
-    monkeypatch.setattr(docling.engine, "parse_to_markdown", _stub_parse_to_markdown)
+    monkeypatch.setattr(api_module, "parse_to_markdown", _stub_parse_to_markdown)
     monkeypatch.setattr(api_module, "_check_credible_api", lambda: False)
 
     client = TestClient(api_module.app)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from config import settings
+from translator_agent.translate import memory as memory_module
+from translator_agent.translate import translate_ir
+
+
+def _fake_translate(calls: list[str]):
+    def _translate(_client, _model, _instructions, payload: str) -> str:
+        calls.append(payload)
+        return f"fa:{payload}"
+
+    return _translate
+
+
+def test_translation_memory_reuses_chunks(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "translation_memory", str(tmp_path / "tm.sqlite3"))
+    memory_module.get_memory.cache_clear()
+    calls: list[str] = []
+    monkeypatch.setattr(translate_ir, "translate_text", _fake_translate(calls))
+
+    try:
+        first = translate_ir._translate_chunks(None, "m", "instr", ["Hello", "World", "Hello"])
+        assert first == ["fa:Hello", "fa:World", "fa:Hello"]
+        # Repeats inside one document are only sent once
+        assert sorted(calls) == ["Hello", "World"]
+
+        calls.clear()
+        second = translate_ir._translate_chunks(None, "m", "instr", ["World", "New"])
+        assert second == ["fa:World", "fa:New"]
+        assert calls == ["New"]
+
+        # A different model is a different key
+        calls.clear()
+        translate_ir._translate_chunks(None, "other", "instr", ["World"])
+        assert calls == ["World"]
+    finally:
+        memory_module.get_memory.cache_clear()
+
+
+def test_translation_memory_disabled(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "translation_memory", "")
+    memory_module.get_memory.cache_clear()
+    calls: list[str] = []
+    monkeypatch.setattr(translate_ir, "translate_text", _fake_translate(calls))
+
+    try:
+        assert memory_module.get_memory() is None
+        translate_ir._translate_chunks(None, "m", "instr", ["Hello"])
+        translate_ir._translate_chunks(None, "m", "instr", ["Hello"])
+        assert calls == ["Hello", "Hello"]
+    finally:
+        memory_module.get_memory.cache_clear()
@@ -0,0 +1,72 @@
+"""
+Disk-backed translation memory.
+
+Translated chunks are stored in SQLite keyed by a BLAKE2b digest of
+(model, instructions, source text), so re-running a document, or repeating a
+paragraph inside one, reuses the earlier translation instead of calling the API.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default host-parameter limit is 999 on older builds.
+_MAX_PARAMS = 500
+
+
+def chunk_key(model: str, instructions: str, text: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for part in (model, instructions, text):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.digest()
+
+
+class TranslationMemory:
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tm (key BLOB PRIMARY KEY, translation TEXT NOT NULL)"
+        )
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, str]:
+        keys = list(dict.fromkeys(keys))
+        found: Dict[bytes, str] = {}
+        with self._lock:
+            for i in range(0, len(keys), _MAX_PARAMS):
+                batch = keys[i:i + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, translation FROM tm WHERE key IN ({placeholders})", batch
+                )
+                found.update(rows)
+        return found
+
+    def put_many(self, items: Dict[bytes, str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tm (key, translation) VALUES (?, ?)", items.items()
+            )
+
+
+@lru_cache(maxsize=1)
+def get_memory() -> Optional[TranslationMemory]:
+    """Process-wide memory at ``settings.translation_memory``; ``None`` when disabled or unusable."""
+    path = settings.translation_memory
+    if not path:
+        return None
+    try:
+        return TranslationMemory(path)
+    except sqlite3.Error as exc:
+        logger.warning("Translation memory disabled, cannot open %s: %s", path, exc)
+        return None
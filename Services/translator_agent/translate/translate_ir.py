@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 import uuid
 from .prompts import build_instructions
 from .openai_client import get_client, translate_text
+from .memory import chunk_key, get_memory
 from ir.schema import Block, InlineSpan
 from nl.chunking import split_paragraph
 from config import settings
@@ -116,30 +118,62 @@ def _tagged_text_to_spans(tagged: str) -> List[InlineSpan]:
     flush_buf()
     return out
 
+def _translate_chunks(client, model: str, instructions: str, chunks: List[str]) -> List[str]:
+    """
+    Translate chunks with up to ``settings.concurrency`` requests in flight, preserving order.
+
+    Chunks already in the translation memory, and repeats within ``chunks``, are not re-sent.
+    """
+    memory = get_memory()
+    keys = [chunk_key(model, instructions, ch) for ch in chunks]
+    known = memory.get_many(keys) if memory else {}
+
+    missing: Dict[bytes, str] = {}
+    for key, ch in zip(keys, chunks):
+        if key not in known:
+            missing.setdefault(key, ch)
+
+    todo = list(missing.values())
+    workers = min(settings.concurrency, len(todo))
+    if workers <= 1:
+        results = [translate_text(client, model, instructions, ch) for ch in todo]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda ch: translate_text(client, model, instructions, ch), todo))
+
+    fresh = dict(zip(missing, results))
+    if memory and fresh:
+        memory.put_many(fresh)
+    known.update(fresh)
+    return [known[key] for key in keys]
+
 def translate_ir_to_fa(ir: dict, *, model: str, glossary: Dict[str,str] | None) -> dict:
     client = get_client()
     instr = build_instructions(glossary)
     max_budget = settings.max_chunk_tokens
 
+    # First pass: split every translatable unit into chunks so that all API calls
+    # can be issued together instead of one round-trip at a time.
+    pending: List[str] = []
+
+    def _queue(spans: List[InlineSpan]) -> slice:
+        tagged = _spans_to_tagged_text(spans)
+        start = len(pending)
+        pending.extend(split_paragraph(tagged, model=model, budget=max_budget))
+        return slice(start, len(pending))
+
     out_blocks: list[Block] = []
+    targets: list[tuple[dict, slice]] = []
     for b in ir.get("blocks", []):
         nb: Block = {"id": b["id"], "type": b["type"], "level": b.get("level",0), "children": [], "attrs": b.get("attrs",{})}
         if b["type"] in ["heading","paragraph","blockquote"]:
-            tagged = _spans_to_tagged_text(b.get("spans", []))
-            chunks = split_paragraph(tagged, model=model, budget=max_budget)
-            translated_chunks = []
-            for ch in chunks:
-                translated_chunks.append(translate_text(client, model, instr, ch))
-            merged = " ".join(translated_chunks)
-            nb["spans"] = _tagged_text_to_spans(merged)
+            targets.append((nb, _queue(b.get("spans", []))))
         elif b["type"] == "list":
             items = []
             for li in b.get("children", []):
-                tagged = _spans_to_tagged_text(li.get("spans", []))
-                chunks = split_paragraph(tagged, model=model, budget=max_budget)
-                translated_chunks = [translate_text(client, model, instr, ch) for ch in chunks]
-                merged = " ".join(translated_chunks)
-                items.append({"id": li["id"], "type": "list_item", "level": 0, "spans": _tagged_text_to_spans(merged), "children": [], "attrs": {}})
+                item = {"id": li["id"], "type": "list_item", "level": 0, "children": [], "attrs": {}}
+                targets.append((item, _queue(li.get("spans", []))))
+                items.append(item)
             nb["children"] = items
             nb["spans"] = []
         elif b["type"] == "codeblock":
@@ -148,4 +182,9 @@ def translate_ir_to_fa(ir: dict, *, model: str, glossary: Dict[str,str] | None)
             nb["spans"] = b.get("spans", [])
         out_blocks.append(nb)
 
+    translated = _translate_chunks(client, model, instr, pending)
+    for node, span_range in targets:
+        merged = " ".join(translated[span_range])
+        node["spans"] = _tagged_text_to_spans(merged)
+
     return {"blocks": out_blocks, "attrs": {"lang": "fa", "dir": "rtl"}}
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import mimetypes
 import re
 import uuid
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -13,8 +14,11 @@ DATA_IMG_RE = re.compile(
     r"\)(?P<attrs>\{\s*[^}]*\})?",
     flags=re.IGNORECASE | re.MULTILINE,
 )
+# Cheap literal probe so documents without inline images skip the full pattern.
+_BASE64_MARKER_RE = re.compile(r";base64,", flags=re.IGNORECASE)
 
 
+@lru_cache(maxsize=None)
 def _guess_extension(mime: str) -> str:
     ext = mimetypes.guess_extension(mime)
     if ext:
@@ -39,14 +43,16 @@ def deinline_data_uri_images(md_text: str, assets_dir: Path) -> str:
     str
         Markdown with image references rewritten to point at ``assets/<file>``.
     """
-    assets_dir.mkdir(parents=True, exist_ok=True)
+    if not _BASE64_MARKER_RE.search(md_text):
+        return md_text
 
     def _replace(match: re.Match) -> str:
         mime = match.group("mime")
-        b64_data = match.group("b64").replace("\n", "").replace("\r", "")
-        ext = _guess_extension(mime)
+        ext = _guess_extension(mime.lower())
         filename = f"img_{uuid.uuid4().hex}{ext}"
-        binary = base64.b64decode(b64_data)
+        # a2b_base64 skips the embedded line breaks, so no pre-strip copy is needed.
+        binary = binascii.a2b_base64(match.group("b64"))
+        assets_dir.mkdir(parents=True, exist_ok=True)
         (assets_dir / filename).write_bytes(binary)
         attrs = match.group("attrs") or ""
         return f"![{match.group('alt')}]({assets_dir.name}/{filename}){attrs}"